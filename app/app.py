@@ -5,22 +5,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from flask import Flask, redirect, url_for
 from flask_dance.contrib.google import make_google_blueprint, google
 from flask_dance.contrib.facebook import make_facebook_blueprint, facebook
-from flask_sqlalchemy import SQLAlchemy
 from flask_dance.consumer import oauth_error
 
-from modules.web_application.api.prompt_routes import prompt_bp
-from modules.web_application.api.user_routes import user_bp
-from modules.web_application.api.scrapping_routes import scrape_bp
+from app.modules.web_application.models.models import app, db
+from app.modules.web_application.api.prompt_routes import prompt_bp
+from app.modules.web_application.api.user_routes import user_bp
+from app.modules.web_application.api.scrapping_routes import scrape_bp
+from app.modules.web_application.api.metrics_routes import metrics_bp
 from dotenv import load_dotenv
 
 load_dotenv()
 
-app = Flask(__name__)
 app.config["secret_key"] = os.getenv("secret_key")
-app.config["pg_connection_string"] = os.getenv(
-    "pg_connection_string", "sqlite:///test.db"
-)
-db = SQLAlchemy(app)
 google_blueprint_obj = make_google_blueprint(
     client_id=os.getenv("google_auth_client_id"),
     client_secret=os.getenv("google_auth_secret_key"),
@@ -38,6 +34,7 @@ app.register_blueprint(facebook_blueprint_obj, url_prefix="/facebook_login")
 app.register_blueprint(user_bp)
 app.register_blueprint(prompt_bp)
 app.register_blueprint(scrape_bp)
+app.register_blueprint(metrics_bp)
 
 
 @oauth_error.connect_via(google_blueprint_obj)
@@ -0,0 +1,10 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.modules.web_application.models.models import app
+from app.modules.web_application.methods.simhash_methods import NearDuplicateService
+
+if __name__ == "__main__":
+    with app.app_context():
+        print(f"Indexed {NearDuplicateService.backfill()} scrapes")
@@ -0,0 +1,365 @@
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from app.benchmarks.fixtures import FakeWhois, FixtureServer, build_corpus
+from app.config.config import Config, MetricsConfig, PromptConfig, ScraperConfig
+
+SCENARIOS = (
+    "user_create",
+    "user_get",
+    "user_list",
+    "user_search",
+    "user_update",
+    "scrape_static",
+    "scrape_js",
+    "prompt_summarize",
+    "prompt_retrieve",
+)
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(values):
+    summary = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+    summary["mean"] = sum(values) / len(values) if values else None
+    return summary
+
+
+def parse_server_timing(header):
+    timings = {}
+    for entry in (header or "").split(","):
+        name, _, params = entry.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if name and key.strip() == "dur":
+                timings[name] = float(value) / 1000
+    return timings
+
+
+def current_rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+
+class BenchmarkContext:
+    def __init__(self, flask_app, fixture, user_ids, auth_headers, run_id):
+        self.flask_app = flask_app
+        self.fixture = fixture
+        self.user_ids = user_ids
+        self.auth_headers = auth_headers
+        self.run_id = run_id
+        self.static_urls = [fixture.url(path) for path in fixture.paths("/static/")]
+        self.js_urls = [fixture.url(path) for path in fixture.paths("/app/")]
+
+    def request(self, client, scenario, index):
+        if scenario == "user_create":
+            return client.post(
+                "/api/users",
+                json={
+                    "name": f"Bench User {index}",
+                    "email": f"bench-{self.run_id}-{index}@fixture.example",
+                },
+            )
+        if scenario == "user_get":
+            return client.get(f"/api/users/{self.user_ids[index % len(self.user_ids)]}")
+        if scenario == "user_list":
+            return client.get("/api/users?limit=50")
+        if scenario == "user_search":
+            return client.get(f"/api/users?search=seed{index % 100}")
+        if scenario == "user_update":
+            user_id = self.user_ids[index % len(self.user_ids)]
+            return client.put(f"/api/users/{user_id}", json={"name": f"Seed {index}"})
+        if scenario in ("scrape_static", "scrape_js"):
+            urls = self.static_urls if scenario == "scrape_static" else self.js_urls
+            return client.post(
+                "/scrape",
+                json={"url": urls[index % len(urls)], "max_age": 0},
+                headers=self.auth_headers,
+            )
+        if scenario in ("prompt_summarize", "prompt_retrieve"):
+            return client.post(
+                "/generate-prompt",
+                json={
+                    "url": self.static_urls[index % len(self.static_urls)],
+                    "prompt": "What does this company sell and who are its customers?",
+                    "mode": scenario.split("_", 1)[1],
+                },
+                headers=self.auth_headers,
+            )
+        raise ValueError(f"Unknown scenario {scenario}")
+
+
+def create_app(args):
+    Config.postgres_connection_string = args.database_uri or (
+        "sqlite:///" + os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    )
+    PromptConfig.llm_provider = "fake"
+    PromptConfig.fake_llm_latency = args.llm_latency
+    MetricsConfig.enabled = True
+    MetricsConfig.server_timing = True
+    ScraperConfig.fetch_strategy = "auto" if args.chromedriver else "http"
+    ScraperConfig.chromedriver_path = args.chromedriver
+
+    from app.modules.web_application.methods import whois_methods
+
+    whois_methods.whois = types.SimpleNamespace(whois=FakeWhois(args.whois_latency))
+
+    started = time.perf_counter()
+    from app.app import app as flask_app
+
+    import_seconds = time.perf_counter() - started
+
+    from flask_login import LoginManager, UserMixin
+
+    class BenchUser(UserMixin):
+        def __init__(self, user_id):
+            self.id = user_id
+
+    login_manager = LoginManager(flask_app)
+
+    @login_manager.request_loader
+    def load_bench_user(request):
+        user_id = request.headers.get("X-Bench-User")
+        return BenchUser(int(user_id)) if user_id else None
+
+    flask_app.config["TESTING"] = True
+    return flask_app, import_seconds
+
+
+def lazy_init_seconds():
+    return {
+        resource.name: resource.init_seconds
+        for name, module in list(sys.modules.items())
+        if name.endswith("methods.lazy_methods")
+        for resource in module.resources
+    }
+
+
+def seed_users(client, run_id, count):
+    lines = "\n".join(
+        json.dumps(
+            {
+                "name": f"Seed{index} User",
+                "email": f"seed-{run_id}-{index}@fixture.example",
+            }
+        )
+        for index in range(count)
+    )
+    response = client.post(
+        "/api/users/bulk", data=lines, content_type="application/x-ndjson"
+    )
+    return [
+        result["id"]
+        for result in response.get_json()["results"]
+        if result.get("id") is not None
+    ]
+
+
+def run_scenario(context, scenario, total, concurrency, warmup):
+    clients = threading.local()
+
+    def client():
+        if not hasattr(clients, "client"):
+            clients.client = context.flask_app.test_client()
+        return clients.client
+
+    def timed(index):
+        started = time.perf_counter()
+        response = context.request(client(), scenario, index)
+        response.get_data()
+        elapsed = time.perf_counter() - started
+        return (
+            elapsed,
+            response.status_code,
+            parse_server_timing(response.headers.get("Server-Timing")),
+        )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(-warmup, 0)))
+        with RssSampler() as sampler:
+            started = time.perf_counter()
+            results = list(executor.map(timed, range(total)))
+            wall = time.perf_counter() - started
+
+    latencies = [elapsed for elapsed, _, _ in results]
+    stages = {}
+    for _, _, timings in results:
+        for name, seconds in timings.items():
+            if name != "total":
+                stages.setdefault(name, []).append(seconds)
+
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": sum(1 for _, status, _ in results if status >= 400),
+        "latency": summarize(latencies),
+        "throughput": total / wall if wall else None,
+        "peak_rss_mb": round(sampler.peak / 1024 / 1024, 1),
+        "stages": {name: summarize(values) for name, values in sorted(stages.items())},
+    }
+
+
+def compare(current, baseline, threshold):
+    regressions = []
+    print(
+        f"\n{'scenario':<18} {'conc':>5} {'p95_base':>9} {'p95_now':>9} "
+        f"{'delta':>7} {'rps_base':>9} {'rps_now':>9}"
+    )
+    for key, result in current["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if previous is None:
+            continue
+        base_p95 = previous["latency"]["p95"]
+        now_p95 = result["latency"]["p95"]
+        delta = (now_p95 - base_p95) / base_p95 * 100 if base_p95 else 0.0
+        flag = " !" if delta > threshold else ""
+        if flag:
+            regressions.append(key)
+        print(
+            f"{result['scenario']:<18} {result['concurrency']:>5} "
+            f"{base_p95 * 1000:>8.1f}ms {now_p95 * 1000:>8.1f}ms {delta:>+6.1f}% "
+            f"{previous['throughput']:>9.1f} {result['throughput']:>9.1f}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Drive the Flask endpoints offline against a local fixture site"
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed-users", type=int, default=1000)
+    parser.add_argument("--static-pages", type=int, default=50)
+    parser.add_argument("--js-pages", type=int, default=10)
+    parser.add_argument("--site-latency", type=float, default=0.01)
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--whois-latency", type=float, default=0.2)
+    parser.add_argument("--chromedriver", default=os.getenv("chromedriver_path"))
+    parser.add_argument("--database-uri")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    parser.add_argument("--max-import-seconds", type=float)
+    args = parser.parse_args()
+
+    run_id = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    corpus = build_corpus(args.static_pages, args.js_pages)
+    with FixtureServer(corpus, latency=args.site_latency) as fixture:
+        flask_app, import_seconds = create_app(args)
+        print(f"Imported app in {import_seconds * 1000:.1f}ms")
+        if args.max_import_seconds and import_seconds > args.max_import_seconds:
+            print(f"Import exceeded {args.max_import_seconds}s budget")
+            sys.exit(1)
+        client = flask_app.test_client()
+        user_ids = seed_users(client, run_id, args.seed_users)
+        bench_user = client.post(
+            "/api/users",
+            json={"name": "Bench Owner", "email": f"owner-{run_id}@fixture.example"},
+        ).get_json()["data"]["user_id"]
+        context = BenchmarkContext(
+            flask_app, fixture, user_ids, {"X-Bench-User": str(bench_user)}, run_id
+        )
+
+        if not args.chromedriver and "scrape_js" in args.scenarios:
+            print("No chromedriver configured; scrape_js runs on the HTTP tier only")
+
+        results = {}
+        print(
+            f"{'scenario':<18} {'conc':>5} {'p50':>8} {'p95':>8} {'p99':>8} "
+            f"{'rps':>8} {'errors':>6} {'rss_mb':>7}"
+        )
+        for scenario in args.scenarios:
+            for concurrency in args.concurrency:
+                result = run_scenario(
+                    context, scenario, args.requests, concurrency, args.warmup
+                )
+                result["scenario"] = scenario
+                results[f"{scenario}@{concurrency}"] = result
+                latency = result["latency"]
+                print(
+                    f"{scenario:<18} {concurrency:>5} {latency['p50'] * 1000:>6.1f}ms "
+                    f"{latency['p95'] * 1000:>6.1f}ms {latency['p99'] * 1000:>6.1f}ms "
+                    f"{result['throughput']:>8.1f} {result['errors']:>6} "
+                    f"{result['peak_rss_mb']:>7.1f}"
+                )
+                for name, timing in result["stages"].items():
+                    print(
+                        f"  {name:<16} {'':>5} {timing['p50'] * 1000:>6.1f}ms "
+                        f"{timing['p95'] * 1000:>6.1f}ms {timing['p99'] * 1000:>6.1f}ms"
+                    )
+
+    report = {
+        "meta": {
+            "run_id": run_id,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "import_seconds": import_seconds,
+            "lazy_init_seconds": lazy_init_seconds(),
+            "fixture_requests": fixture.requests,
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"\nSaved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(report, json.load(baseline_file), args.threshold)
+        if regressions:
+            print(f"\nRegressed beyond {args.threshold}% p95: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from bs4 import BeautifulSoup
+
+from app.modules.web_application.methods.extraction_methods import ExtractionEngine
+
+
+def build_page(sections):
+    blocks = []
+    for index in range(sections):
+        blocks.append(f"""
+            <section id="s{index}">
+              <h2>Section {index}</h2>
+              <div class="card"><p>Lorem ipsum dolor sit amet, consectetur adipiscing
+              elit. Technology and finance teams collaborate on healthcare data.</p>
+              <ul>{"".join(f'<li><a href="/item/{index}/{n}">Item {n}</a></li>' for n in range(10))}</ul>
+              </div>
+              <script>window.__state_{index} = {{"k": {index}}};</script>
+            </section>""")
+    return f"""<!DOCTYPE html>
+<html><head>
+  <title>Benchmark Corp</title>
+  <meta name="description" content="Synthetic benchmark page">
+  <meta property="og:title" content="Benchmark Corp">
+  <style>body {{ font-family: sans-serif; }}</style>
+</head><body>
+  <div class="about-us">About Benchmark Corp: we build things.</div>
+  {"".join(blocks)}
+  <a href="tel:+15550100">Call us</a>
+  <form action="/subscribe"><input name="email"></form>
+</body></html>"""
+
+
+def legacy_extract(html):
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.string if soup.title else ""
+    description_tag = soup.find("meta", attrs={"name": "description"})
+    description = description_tag["content"] if description_tag else ""
+
+    name = ""
+    for candidate in soup.find_all(["h1", "title", "meta"]):
+        if candidate.get("property") == "og:title":
+            name = candidate.get("content")
+            break
+
+    about_sections = soup.find_all(
+        ["div", "p"], class_=re.compile(r"about|description|bio", re.IGNORECASE)
+    )
+    about = " ".join([section.get_text() for section in about_sections])[:500]
+
+    contact_tags = soup.find_all(["a"], href=re.compile(r"tel:|contact", re.IGNORECASE))
+    contact = contact_tags[0].get("href") if contact_tags else ""
+
+    if soup.find("article"):
+        page_type = "Blog/Article"
+    elif soup.find("profile"):
+        page_type = "Profile Page"
+    elif soup.find("form"):
+        page_type = "Contact/Landing Page"
+    else:
+        page_type = "General Website"
+
+    return {
+        "title": title,
+        "description": description,
+        "name": name,
+        "about": about,
+        "contact": contact,
+        "page_content_type": page_type,
+        "text": soup.get_text(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the single-pass extraction engine with the legacy soup path"
+    )
+    parser.add_argument("--sections", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = ExtractionEngine()
+    print(
+        f"{'sections':>8} {'size_kb':>8} {'legacy_ms':>10} {'engine_ms':>10} {'speedup':>8}"
+    )
+    for sections in args.sections:
+        html = build_page(sections)
+        legacy = min(
+            timeit.repeat(lambda: legacy_extract(html), number=1, repeat=args.repeat)
+        )
+        single = min(
+            timeit.repeat(lambda: engine.extract(html), number=1, repeat=args.repeat)
+        )
+        print(
+            f"{sections:>8} {len(html) // 1024:>8} {legacy * 1000:>10.1f} "
+            f"{single * 1000:>10.1f} {legacy / single:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import hashlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+INDUSTRY_PHRASES = (
+    "cloud software platform for enterprise developers",
+    "digital banking and payments infrastructure",
+    "telehealth services for hospitals and clinics",
+    "renewable energy storage and solar installation",
+    "online retail marketplace and logistics",
+    "industrial manufacturing automation and robotics",
+)
+
+FILLER = (
+    "Our team partners with customers across the world to deliver measurable "
+    "outcomes. We invest in research, security and compliance, and publish "
+    "regular updates on our roadmap, pricing and integrations."
+).split()
+
+
+def paragraph(generator, words=80):
+    return " ".join(generator.choice(FILLER) for _ in range(words)) + "."
+
+
+def static_page(index, sections=20):
+    generator = random.Random(index)
+    industry = INDUSTRY_PHRASES[index % len(INDUSTRY_PHRASES)]
+    blocks = "".join(
+        f"<section><h2>Section {n}</h2><p>{paragraph(generator)}</p>"
+        f"<ul>{''.join(f'<li><a href=/static/{(index + k) % 50}>Link {k}</a></li>' for k in range(5))}</ul>"
+        "</section>"
+        for n in range(sections)
+    )
+    return f"""<!DOCTYPE html>
+<html><head>
+  <title>Fixture Company {index}</title>
+  <meta name="description" content="Fixture Company {index} builds {industry}">
+  <meta property="og:site_name" content="Fixture Company {index}">
+  <style>body {{ font-family: sans-serif; }}</style>
+</head><body>
+  <header><nav><a href="/">Home</a><a href="/about">About</a></nav></header>
+  <div class="about-us">About Fixture Company {index}: we provide {industry}.</div>
+  {blocks}
+  <footer class="contact">Contact us at hello{index}@fixture.example or +1 555 01{index % 100:02d}</footer>
+</body></html>"""
+
+
+def js_page(index, bundle_kb=200):
+    generator = random.Random(index + 10000)
+    industry = INDUSTRY_PHRASES[index % len(INDUSTRY_PHRASES)]
+    bundle = "".join(
+        f"var m{n}=function(a){{return a*{generator.randint(1, 999)}}};"
+        for n in range(bundle_kb * 1024 // 36)
+    )
+    content = paragraph(generator, 400).replace("'", "")
+    return f"""<!DOCTYPE html>
+<html><head>
+  <title>Fixture App {index}</title>
+  <meta name="description" content="Fixture App {index} builds {industry}">
+</head><body>
+  <div id="root"></div>
+  <noscript>You need to enable JavaScript to run this app.</noscript>
+  <script>{bundle}</script>
+  <script>
+    document.getElementById('root').innerHTML =
+      '<div class="about">About Fixture App {index}: we provide {industry}.</div>' +
+      '<p>{content}</p>' +
+      '<div class="contact">Contact app{index}@fixture.example</div>';
+  </script>
+</body></html>"""
+
+
+def build_corpus(static_pages=50, js_pages=10, bundle_kb=200):
+    corpus = {}
+    for index in range(static_pages):
+        corpus[f"/static/{index}"] = static_page(index)
+    for index in range(js_pages):
+        corpus[f"/app/{index}"] = js_page(index, bundle_kb)
+    return corpus
+
+
+class FixtureServer:
+    def __init__(self, corpus, latency=0.0, host="127.0.0.1", port=0):
+        self.corpus = {
+            path: (
+                body.encode("utf-8"),
+                hashlib.sha256(body.encode("utf-8")).hexdigest(),
+            )
+            for path, body in corpus.items()
+        }
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, name="fixture-server", daemon=True
+        )
+
+    def _handler(self):
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with fixture._lock:
+                    fixture.requests += 1
+                if fixture.latency:
+                    time.sleep(fixture.latency)
+                entry = fixture.corpus.get(self.path.split("?", 1)[0])
+                if entry is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body, digest = entry
+                etag = f'"{digest[:16]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return self.base_url + path
+
+    def paths(self, prefix):
+        return sorted(
+            (path for path in self.corpus if path.startswith(prefix)),
+            key=lambda path: int(path.rsplit("/", 1)[1]),
+        )
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class FakeWhois:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, domain):
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return {
+            "domain_name": domain.upper(),
+            "registrar": "Fixture Registrar, Inc.",
+            "creation_date": "2015-06-01T00:00:00",
+            "expiration_date": "2030-06-01T00:00:00",
+            "name_servers": [f"ns1.{domain}", f"ns2.{domain}"],
+            "country": "US",
+        }
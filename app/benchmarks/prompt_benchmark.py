@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from langchain.schema import Document
+
+from app.config.config import PromptConfig
+from app.modules.web_application.methods.llm_methods import FakeLLM
+from app.modules.web_application.methods.prompt_methods import PromptService
+
+WORDS = (
+    "platform customers revenue engineering teams product security cloud "
+    "analytics partners support pricing integration roadmap compliance"
+).split()
+
+
+def build_document(pages, seed):
+    paragraphs = []
+    for index in range(pages * 20):
+        words = [WORDS[(index * 7 + seed + n) % len(WORDS)] for n in range(60)]
+        paragraphs.append(" ".join(words) + ".")
+    return Document(page_content="\n\n".join(paragraphs), metadata={"seed": seed})
+
+
+def run(pages, concurrency, latency):
+    PromptConfig.map_concurrency = concurrency
+    llm = FakeLLM(latency=latency)
+    service = PromptService(llm=llm)
+    document = build_document(pages, seed=pages * 31 + concurrency)
+
+    started = time.perf_counter()
+    events = list(
+        service.document_summary_events(f"bench://{pages}/{concurrency}", [document])
+    )
+    elapsed = time.perf_counter() - started
+    chunks = next(event["chunks"] for event in events if event["event"] == "split")
+    levels = sum(1 for event in events if event["event"] == "reduce")
+    service.map_executor.shutdown()
+    return chunks, levels, llm.calls, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure map/reduce summarization scaling with a fake LLM"
+    )
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    print(
+        f"{'pages':>6} {'chunks':>7} {'workers':>8} {'levels':>7} "
+        f"{'llm_calls':>10} {'seconds':>8}"
+    )
+    for pages in args.pages:
+        for concurrency in args.concurrency:
+            chunks, levels, calls, elapsed = run(pages, concurrency, args.latency)
+            print(
+                f"{pages:>6} {chunks:>7} {concurrency:>8} {levels:>7} "
+                f"{calls:>10} {elapsed:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
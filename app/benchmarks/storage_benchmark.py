@@ -0,0 +1,178 @@
+import argparse
+import hashlib
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+from app.modules.web_application.methods.content_methods import (
+    compress,
+    decompress,
+    default_codec,
+)
+
+WORDS = (
+    "platform customers revenue engineering teams product security cloud "
+    "analytics partners support pricing integration roadmap compliance "
+    "careers privacy contact about solutions enterprise developers blog"
+).split()
+
+LISTING_COLUMNS = (
+    "id, url, name, title, description, industry, domain, content_hash, "
+    "created_by_user_id, created_at"
+)
+
+SCHEMAS = {
+    "inline": (f"CREATE TABLE scraped_data ({LISTING_COLUMNS}, content TEXT)",),
+    "blob": (
+        f"CREATE TABLE scraped_data ({LISTING_COLUMNS}, content_id INTEGER)",
+        "CREATE TABLE scraped_content (id INTEGER PRIMARY KEY, content_hash TEXT, "
+        "codec TEXT, size INTEGER, stored_size INTEGER, data BLOB)",
+    ),
+}
+
+LISTING_QUERIES = {
+    "inline": "SELECT * FROM scraped_data",
+    "blob": f"SELECT {LISTING_COLUMNS}, content_id FROM scraped_data",
+}
+
+
+def build_text(kb, seed):
+    generator = random.Random(seed)
+    words = []
+    size = 0
+    while size < kb * 1024:
+        word = generator.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def populate(path, layout, rows, kb, codec):
+    connection = sqlite3.connect(path)
+    for statement in SCHEMAS[layout]:
+        connection.execute(statement)
+    connection.execute(
+        "CREATE INDEX ix_scraped_data_user_created_at_id "
+        "ON scraped_data (created_by_user_id, created_at, id)"
+    )
+    started = datetime(2024, 1, 1)
+    for row in range(1, rows + 1):
+        text = build_text(kb, seed=row)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        values = (
+            row,
+            f"https://example{row}.com",
+            f"Company {row}",
+            f"Company {row} home",
+            "Synthetic benchmark company",
+            "Technology",
+            f"example{row}.com",
+            digest,
+            1,
+            (started + timedelta(seconds=row)).isoformat(),
+        )
+        if layout == "inline":
+            connection.execute(
+                "INSERT INTO scraped_data VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+                values + (text,),
+            )
+        else:
+            raw = text.encode("utf-8")
+            data = compress(raw, codec)
+            connection.execute(
+                "INSERT INTO scraped_content VALUES (?,?,?,?,?,?)",
+                (row, digest, codec, len(raw), len(data), data),
+            )
+            connection.execute(
+                "INSERT INTO scraped_data VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+                values + (row,),
+            )
+    connection.commit()
+    connection.execute("VACUUM")
+    return connection
+
+
+def list_all(connection, layout, limit):
+    query = (
+        f"{LISTING_QUERIES[layout]} WHERE created_by_user_id = 1 "
+        "AND (created_at < ? OR (created_at = ? AND id < ?)) "
+        "ORDER BY created_at DESC, id DESC LIMIT ?"
+    )
+    cursor = ("9999", "9999", 2**62)
+    pages = 0
+    while True:
+        rows = connection.execute(query, cursor + (limit,)).fetchall()
+        if not rows:
+            return pages
+        pages += 1
+        last = rows[-1]
+        cursor = (last[9], last[9], last[0])
+
+
+def fetch_content(connection, layout, row_id):
+    if layout == "inline":
+        return connection.execute(
+            "SELECT content FROM scraped_data WHERE id = ?", (row_id,)
+        ).fetchone()[0]
+    codec, data = connection.execute(
+        "SELECT c.codec, c.data FROM scraped_data d "
+        "JOIN scraped_content c ON c.id = d.content_id WHERE d.id = ?",
+        (row_id,),
+    ).fetchone()
+    return decompress(codec, data).decode("utf-8")
+
+
+def run(layout, rows, kb, limit, repeat, codec):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"{layout}.db")
+        connection = populate(path, layout, rows, kb, codec)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        pages = list_all(connection, layout, limit)
+        listing = min(
+            timeit.repeat(
+                lambda: list_all(connection, layout, limit), number=1, repeat=repeat
+            )
+        )
+        content = min(
+            timeit.repeat(
+                lambda: fetch_content(connection, layout, rows // 2),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        connection.close()
+    return size_mb, listing / pages, content
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare inline raw content with compressed deferred blobs"
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--kb", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--codec", choices=["zstd", "zlib"], default=default_codec())
+    args = parser.parse_args()
+
+    print(f"{'layout':>7} {'rows':>6} {'db_mb':>8} {'page_ms':>8} {'content_ms':>11}")
+    for rows in args.rows:
+        for layout in ("inline", "blob"):
+            size_mb, page, content = run(
+                layout, rows, args.kb, args.limit, args.repeat, args.codec
+            )
+            print(
+                f"{layout:>7} {rows:>6} {size_mb:>8.1f} {page * 1000:>8.2f} "
+                f"{content * 1000:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
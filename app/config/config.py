@@ -12,3 +12,134 @@ class Config:
 class AlchemyConfig:
     alchemy_config = "sqlite:///oauth.db"
     track_modifications = False
+
+
+class ScraperConfig:
+    driver_pool_size = int(os.getenv("driver_pool_size", os.cpu_count() or 1))
+    driver_warm_size = int(os.getenv("driver_warm_size", 1))
+    driver_max_pages = int(os.getenv("driver_max_pages", 50))
+    driver_checkout_timeout = float(os.getenv("driver_checkout_timeout", 30))
+    page_load_timeout = int(os.getenv("page_load_timeout", 10))
+    fetch_strategy = os.getenv("fetch_strategy", "auto")
+    http_timeout = float(os.getenv("http_timeout", 10))
+    http_pool_size = int(os.getenv("http_pool_size", 32))
+    js_min_text_length = int(os.getenv("js_min_text_length", 200))
+    industry_taxonomy_path = os.getenv("industry_taxonomy_path")
+    chromedriver_path = os.getenv("chromedriver_path")
+
+
+class JobConfig:
+    worker_concurrency = int(os.getenv("job_worker_concurrency", 8))
+    poll_interval = float(os.getenv("job_poll_interval", 2))
+    claim_size = int(os.getenv("job_claim_size", 16))
+    claim_window = int(os.getenv("job_claim_window", 4))
+    lease_seconds = int(os.getenv("job_lease_seconds", 300))
+    max_attempts = int(os.getenv("job_max_attempts", 3))
+    max_batch_size = int(os.getenv("job_max_batch_size", 1000))
+
+
+class WhoisConfig:
+    cache_size = int(os.getenv("whois_cache_size", 4096))
+    ttl = int(os.getenv("whois_ttl", 86400))
+    failure_ttl = int(os.getenv("whois_failure_ttl", 300))
+    shared_cache = os.getenv("whois_shared_cache", "false").lower() == "true"
+    workers = int(os.getenv("whois_workers", 4))
+
+
+class PromptConfig:
+    chunk_size = int(os.getenv("prompt_chunk_size", 1000))
+    chunk_overlap = int(os.getenv("prompt_chunk_overlap", 200))
+    summary_cache_size = int(os.getenv("summary_cache_size", 512))
+    chunk_cache_size = int(os.getenv("chunk_cache_size", 8192))
+    summary_cache_ttl = int(os.getenv("summary_cache_ttl", 3600))
+    llm_provider = os.getenv("llm_provider", "openai")
+    fake_llm_latency = float(os.getenv("fake_llm_latency", 0))
+    map_concurrency = int(os.getenv("map_concurrency", 8))
+    llm_max_retries = int(os.getenv("llm_max_retries", 3))
+    llm_retry_backoff = float(os.getenv("llm_retry_backoff", 0.5))
+    reduce_max_chars = int(os.getenv("reduce_max_chars", 8000))
+    retrieval_top_k = int(os.getenv("retrieval_top_k", 5))
+    retrieval_token_budget = int(os.getenv("retrieval_token_budget", 2000))
+
+
+class UserCacheConfig:
+    size = int(os.getenv("user_cache_size", 10000))
+    ttl = int(os.getenv("user_cache_ttl", 300))
+    shared = os.getenv("user_cache_shared", "")
+
+
+class BulkUserConfig:
+    batch_size = int(os.getenv("bulk_user_batch_size", 1000))
+    max_delete_ids = int(os.getenv("bulk_user_max_delete_ids", 10000))
+
+
+class MediaConfig:
+    upload_folder = os.getenv("upload_folder", "uploads/profile_pictures")
+    chunk_size = int(os.getenv("media_chunk_size", 65536))
+    max_bytes = int(os.getenv("media_max_bytes", 10 * 1024 * 1024))
+    thumbnail_sizes = tuple(
+        int(size) for size in os.getenv("thumbnail_sizes", "64,256").split(",") if size
+    )
+    thumbnail_workers = int(os.getenv("thumbnail_workers", 2))
+    cache_max_age = int(os.getenv("media_cache_max_age", 31536000))
+
+
+class ContentConfig:
+    codec = os.getenv("content_codec", "zstd")
+    zstd_level = int(os.getenv("content_zstd_level", 3))
+    zlib_level = int(os.getenv("content_zlib_level", 6))
+
+
+class WriteBehindConfig:
+    enabled = os.getenv("write_behind_enabled", "false").lower() == "true"
+    batch_size = int(os.getenv("write_behind_batch_size", 200))
+    flush_interval = float(os.getenv("write_behind_flush_interval", 0.5))
+    max_queue = int(os.getenv("write_behind_max_queue", 10000))
+    enqueue_timeout = float(os.getenv("write_behind_enqueue_timeout", 0.05))
+
+
+class MetricsConfig:
+    enabled = os.getenv("metrics_enabled", "true").lower() == "true"
+    server_timing = os.getenv("server_timing_enabled", "true").lower() == "true"
+    profiling_enabled = os.getenv("profiling_enabled", "false").lower() == "true"
+    profile_interval = float(os.getenv("profile_interval", 0.005))
+    profile_dir = os.getenv("profile_dir", "profiles")
+
+
+class SchedulerConfig:
+    concurrency = int(os.getenv("scheduler_concurrency", 8))
+    per_host_concurrency = int(os.getenv("per_host_concurrency", 2))
+    per_host_rate = float(os.getenv("per_host_rate", 1.0))
+    respect_robots = os.getenv("respect_robots", "true").lower() == "true"
+    robots_ttl = int(os.getenv("robots_ttl", 3600))
+    robots_timeout = float(os.getenv("robots_timeout", 5))
+    user_agent = os.getenv("scraper_user_agent", "IDEHScraper")
+    initial_backoff = float(os.getenv("host_initial_backoff", 2))
+    max_backoff = float(os.getenv("host_max_backoff", 120))
+    max_retries = int(os.getenv("host_max_retries", 0))
+
+
+class CrawlConfig:
+    max_depth = int(os.getenv("crawl_max_depth", 2))
+    max_depth_limit = int(os.getenv("crawl_max_depth_limit", 5))
+    max_pages = int(os.getenv("crawl_max_pages", 25))
+    max_pages_limit = int(os.getenv("crawl_max_pages_limit", 200))
+    max_frontier = int(os.getenv("crawl_max_frontier", 5000))
+    in_flight = int(os.getenv("crawl_in_flight", 4))
+    bloom_capacity = int(os.getenv("crawl_bloom_capacity", 50000))
+    bloom_error_rate = float(os.getenv("crawl_bloom_error_rate", 0.001))
+    max_retries = int(os.getenv("crawl_max_retries", 2))
+
+
+class StartupConfig:
+    warm_up = os.getenv("warm_up_resources", "false").lower() == "true"
+
+
+class SimHashConfig:
+    enabled = os.getenv("simhash_enabled", "true").lower() == "true"
+    shingle_size = int(os.getenv("simhash_shingle_size", 3))
+    min_features = int(os.getenv("simhash_min_features", 20))
+    max_distance = int(os.getenv("simhash_max_distance", 3))
+    policy = os.getenv("near_duplicate_policy", "store")
+    reuse_summaries = os.getenv("simhash_reuse_summaries", "true").lower() == "true"
+    index_size = int(os.getenv("simhash_index_size", 10000))
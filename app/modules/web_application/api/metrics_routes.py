@@ -0,0 +1,54 @@
+import time
+
+from flask import Blueprint, Response, g, request
+
+from app.config.config import MetricsConfig
+from app.modules.web_application.methods.metrics_methods import (
+    REQUEST_SECONDS,
+    SamplingProfiler,
+    registry,
+    server_timing_header,
+)
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.before_app_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    if MetricsConfig.profiling_enabled and request.headers.get("X-Profile"):
+        g.profiler = SamplingProfiler().start()
+
+
+@metrics_bp.after_app_request
+def record_request(response):
+    started = g.pop("request_started", None)
+    if started is None:
+        return response
+    elapsed = time.perf_counter() - started
+
+    if MetricsConfig.enabled:
+        REQUEST_SECONDS.observe(
+            elapsed,
+            request.endpoint or "unmatched",
+            request.method,
+            response.status_code,
+        )
+    if MetricsConfig.server_timing:
+        response.headers["Server-Timing"] = server_timing_header(
+            g.get("stage_timings"), total=elapsed
+        )
+
+    profiler = g.pop("profiler", None)
+    if profiler is not None:
+        profiler.stop()
+        response.headers["X-Profile-Samples"] = str(profiler.samples)
+        response.headers["X-Profile-Output"] = profiler.save(
+            request.endpoint or "unmatched"
+        )
+    return response
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4")
@@ -1,8 +1,32 @@
-from flask import Blueprint, request, jsonify
+import json
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from flask_login import current_user
+from app.config.config import StartupConfig
+from app.modules.web_application.methods.lazy_methods import LazyResource
 from app.modules.web_application.methods.prompt_methods import PromptService
 
 prompt_bp = Blueprint("prompt", __name__)
-processor = PromptService()
+processor = LazyResource(PromptService, name="prompt_service")
+
+
+@prompt_bp.before_app_request
+def warm_up_processor():
+    if StartupConfig.warm_up:
+        processor.warm_up()
+
+
+def format_ndjson(events):
+    for event in events:
+        yield json.dumps(event) + "\n"
+
+
+def format_sse(events):
+    for event in events:
+        yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+
+
+def current_user_id():
+    return current_user.id if current_user.is_authenticated else None
 
 
 @prompt_bp.route("/generate-prompt", methods=["POST"])
@@ -10,12 +34,31 @@ def generate_prompt():
     data = request.json
     url = data.get("url")
     user_prompt = data.get("prompt")
+    mode = data.get("mode", "summarize")
 
     if not url or not user_prompt:
         return jsonify({"error": "URL and prompt are required"}), 400
+    if mode not in ("summarize", "retrieve"):
+        return jsonify({"error": "mode must be 'summarize' or 'retrieve'"}), 400
+
+    if data.get("stream"):
+        events = processor.get().stream_prompt(
+            current_user_id(), url, user_prompt, mode=mode
+        )
+        if "text/event-stream" in request.headers.get("Accept", ""):
+            body, mimetype = format_sse(events), "text/event-stream"
+        else:
+            body, mimetype = format_ndjson(events), "application/x-ndjson"
+        return Response(
+            stream_with_context(body),
+            mimetype=mimetype,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
     try:
-        result = processor.process_prompt(url, user_prompt)
+        result = processor.get().process_prompt(
+            current_user_id(), url, user_prompt, mode=mode
+        )
         return jsonify(result), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
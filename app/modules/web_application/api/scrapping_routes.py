@@ -1,17 +1,45 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from flask_login import login_required, current_user
-from modules.web_application.models import ScrapedData
-from modules.web_application.methods.scrapping_methods import WebScraperMethods
+from sqlalchemy.orm import selectinload
+from app.modules.web_application.methods.scrapping_methods import WebScraperMethods
+from app.modules.web_application.methods.scrape_store_methods import ScrapeStoreService
+from app.modules.web_application.methods.job_methods import ScrapeJobService
+from app.modules.web_application.methods.crawl_methods import SiteCrawler, normalize_url
+from app.modules.web_application.methods.scheduler_methods import HostScheduler
+from app.modules.web_application.methods.lazy_methods import LazyResource
+from app.modules.web_application.methods.write_behind_methods import write_behind
+from app.modules.web_application.methods.content_methods import (
+    CONTENT_ENCODINGS,
+    ContentStore,
+    decompress,
+)
+from app.modules.web_application.methods.pagination_methods import (
+    paginate,
+    parse_fields,
+    parse_limit,
+    project,
+)
+from app.modules.web_application.methods.serializer_methods import (
+    dumps,
+    json_response,
+    serialize_scrape,
+    stream_list_response,
+)
+from app.modules.web_application.models.models import SCRAPE_FIELDS, ScrapedData, db
+from app.config.config import CrawlConfig, JobConfig, StartupConfig
 from flask import current_app
-from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
 
-app = Flask(__name__)
-db = SQLAlchemy(app)
-app = Flask(__name__)
-db = SQLAlchemy(app)
 scrape_bp = Blueprint("scrape", __name__)
-scraper = WebScraperMethods()
+scraper = LazyResource(WebScraperMethods, name="scraper")
+crawl_scheduler = LazyResource(
+    lambda: HostScheduler(max_retries=CrawlConfig.max_retries), name="crawl_scheduler"
+)
+
+
+@scrape_bp.before_app_request
+def warm_up_scraper():
+    if StartupConfig.warm_up:
+        scraper.warm_up()
 
 
 @scrape_bp.route("/scrape", methods=["POST"])
@@ -19,27 +47,188 @@ scraper = WebScraperMethods()
 def scrape_url():
     data = request.json
     url = data.get("url")
+    max_age = data.get("max_age")
+
+    if max_age is not None and (not isinstance(max_age, int) or max_age < 0):
+        return jsonify({"error": "max_age must be a non-negative integer"}), 400
 
     try:
-        scraped_data = scraper.scrape_url(url)
-        new_scrape = ScrapedData(user_id=current_user.id, url=url, **scraped_data)
-        db.session.add(new_scrape)
-        db.session.commit()
+        new_scrape = ScrapeStoreService.scrape(
+            scraper.get(), current_user.id, url, max_age=max_age, defer=True
+        )
+
+        payload = {
+            "message": "Data scrapped successfully",
+            "data": serialize_scrape(new_scrape),
+        }
+        if new_scrape.id is None:
+            payload["deferred"] = True
+        return json_response(payload)
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
 
+
+@scrape_bp.route("/scrape/crawl", methods=["POST"])
+@login_required
+def crawl_site():
+    data = request.json or {}
+    url = data.get("url")
+    max_depth = data.get("max_depth", CrawlConfig.max_depth)
+    max_pages = data.get("max_pages", CrawlConfig.max_pages)
+
+    if not isinstance(url, str) or normalize_url(url) is None:
+        return jsonify({"error": "A valid http(s) URL is required"}), 400
+    if not isinstance(max_depth, int) or not (
+        0 <= max_depth <= CrawlConfig.max_depth_limit
+    ):
+        return (
+            jsonify(
+                {
+                    "error": "max_depth must be an integer between 0 and "
+                    f"{CrawlConfig.max_depth_limit}"
+                }
+            ),
+            400,
+        )
+    if not isinstance(max_pages, int) or not (
+        1 <= max_pages <= CrawlConfig.max_pages_limit
+    ):
         return (
             jsonify(
-                {"message": "Data scrapped successfully", "data": new_scrape.to_dict()}
+                {
+                    "error": "max_pages must be an integer between 1 and "
+                    f"{CrawlConfig.max_pages_limit}"
+                }
             ),
-            200,
+            400,
         )
 
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": str(e)}), 500
+    crawler = SiteCrawler(
+        scraper.get(), crawl_scheduler.get(), max_depth=max_depth, max_pages=max_pages
+    )
+    events = crawler.crawl(current_user.id, url)
+
+    def generate():
+        for event in events:
+            if "scrape" in event:
+                event = dict(event, scrape=serialize_scrape(event["scrape"]))
+            yield dumps(event) + b"\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @scrape_bp.route("/scrapes", methods=["GET"])
 @login_required
 def get_user_scrapes():
-    scrapes = ScrapedData.query.filter_by(user_id=current_user.id).all()
-    return jsonify({"scrapes": [scrape.to_dict() for scrape in scrapes]}), 200
+    try:
+        limit = parse_limit(request.args.get("limit"))
+        fields = parse_fields(request.args.get("fields"), SCRAPE_FIELDS)
+        query = ScrapedData.query.filter_by(user_id=current_user.id).options(
+            selectinload(ScrapedData.canonical)
+        )
+        if fields:
+            query = project(query, ScrapedData, fields + ["canonical_id"])
+        scrapes, next_cursor = paginate(
+            query, ScrapedData, limit=limit, cursor=request.args.get("cursor")
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return stream_list_response(
+        "scrapes",
+        scrapes,
+        lambda scrape: serialize_scrape(scrape, fields),
+        extra={"next_cursor": next_cursor},
+    )
+
+
+@scrape_bp.route("/scrapes/<int:scrape_id>/content", methods=["GET"])
+@login_required
+def get_scrape_content(scrape_id):
+    scrape = ScrapedData.query.filter_by(id=scrape_id, user_id=current_user.id).first()
+    if not scrape:
+        return jsonify({"error": "Scrape not found"}), 404
+
+    if scrape.content_hash and request.if_none_match.contains_weak(scrape.content_hash):
+        response = Response(status=304)
+    else:
+        blob = ContentStore.blob(scrape)
+        if blob is None:
+            response = Response(ContentStore.text(scrape) or "", mimetype="text/plain")
+        else:
+            encoding = CONTENT_ENCODINGS[blob.codec]
+            if request.accept_encodings[encoding]:
+                response = Response(blob.data, mimetype="text/plain")
+                response.headers["Content-Encoding"] = encoding
+            else:
+                response = Response(
+                    decompress(blob.codec, blob.data), mimetype="text/plain"
+                )
+            response.vary.add("Accept-Encoding")
+
+    if scrape.content_hash:
+        response.set_etag(scrape.content_hash, weak=True)
+    return response
+
+
+@scrape_bp.route("/scrape/batch", methods=["POST"])
+@login_required
+def scrape_batch():
+    data = request.json or {}
+    urls = data.get("urls")
+
+    if not isinstance(urls, list) or not urls:
+        return jsonify({"error": "A non-empty list of URLs is required"}), 400
+    if len(urls) > JobConfig.max_batch_size:
+        return (
+            jsonify(
+                {"error": f"At most {JobConfig.max_batch_size} URLs per batch allowed"}
+            ),
+            400,
+        )
+
+    try:
+        job = ScrapeJobService.create_job(current_user.id, urls)
+        return (
+            jsonify(
+                {
+                    "message": "Batch scrape queued",
+                    "job_id": job.id,
+                    "status": job.status,
+                    "total": job.total,
+                }
+            ),
+            202,
+        )
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@scrape_bp.route("/scrape/jobs/<int:job_id>", methods=["GET"])
+@login_required
+def get_scrape_job(job_id):
+    job = ScrapeJobService.get_job(job_id, current_user.id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    offset = request.args.get("offset", 0, type=int)
+    limit = request.args.get("limit", 100, type=int)
+    if offset < 0:
+        return jsonify({"error": "offset must be a non-negative integer"}), 400
+    if limit < 1:
+        return jsonify({"error": "limit must be positive"}), 400
+    limit = min(limit, 1000)
+    return json_response(ScrapeJobService.job_status(job, offset=offset, limit=limit))
+
+
+@scrape_bp.route("/write-behind/stats", methods=["GET"])
+@login_required
+def get_write_behind_stats():
+    return json_response(write_behind.stats())
@@ -1,24 +1,41 @@
-from flask import Blueprint, request, jsonify
+from collections import Counter
+from flask import Blueprint, request, send_file, url_for
 from werkzeug.utils import secure_filename
 from datetime import datetime
 import os
 from http import HTTPStatus
+from app.config.config import BulkUserConfig, MediaConfig
+from app.modules.web_application.methods.import_methods import iter_records
 from app.modules.web_application.methods.methods import UserService
-
+from app.modules.web_application.methods.pagination_methods import (
+    parse_fields,
+    parse_limit,
+)
+from app.modules.web_application.methods.serializer_methods import (
+    USER_FIELDS,
+    conditional_json_response,
+    json_response,
+    serialize_user,
+    stream_list_response,
+    user_etag,
+)
 
 user_bp = Blueprint("user", __name__, url_prefix="/api/users")
 
 
-def create_response(data=None, message=None, status=HTTPStatus.OK):
+def create_response(data=None, message=None, status=HTTPStatus.OK, next_cursor=None):
     response = {}
     if data is not None:
         response["data"] = data
     if message is not None:
         response["message"] = message
-    return jsonify(response), status
+    if next_cursor is not None:
+        response["next_cursor"] = next_cursor
+    return json_response(response, status=status)
 
 
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "gif"}
+IMAGE_MIMETYPES = {"image/png", "image/jpeg", "image/gif"}
 
 
 def allowed_file(filename):
@@ -63,25 +80,24 @@ def get_users():
         search_term = request.args.get("search")
         provider = request.args.get("provider")
 
-        if search_term:
-            users = UserService.search_users(search_term)
-        elif provider:
-            users = UserService.get_users_by_provider(provider)
-        else:
-            users = UserService.get_all_users()
-
-        return create_response(
-            data=[
-                {
-                    "id": user.id,
-                    "name": user.name,
-                    "email": user.email,
-                    "social_login_provider": user.social_login_provider,
-                    "profile_picture": user.profile_picture,
-                    "created_at": user.created_at.isoformat(),
-                }
-                for user in users
-            ]
+        try:
+            limit = parse_limit(request.args.get("limit"))
+            fields = parse_fields(request.args.get("fields"), USER_FIELDS)
+            users, next_cursor = UserService.list_users(
+                search_term=search_term,
+                provider=provider,
+                limit=limit,
+                cursor=request.args.get("cursor"),
+                fields=fields,
+            )
+        except ValueError as e:
+            return create_response(message=str(e), status=HTTPStatus.BAD_REQUEST)
+
+        return stream_list_response(
+            "data",
+            users,
+            lambda user: serialize_user(user, fields),
+            extra={"next_cursor": next_cursor} if next_cursor else None,
         )
 
     except Exception as e:
@@ -97,15 +113,8 @@ def get_user(user_id):
                 message="User not found", status=HTTPStatus.NOT_FOUND
             )
 
-        return create_response(
-            data={
-                "id": user.id,
-                "name": user.name,
-                "email": user.email,
-                "social_login_provider": user.social_login_provider,
-                "profile_picture": user.profile_picture,
-                "created_at": user.created_at.isoformat(),
-            }
+        return conditional_json_response(
+            {"data": serialize_user(user)}, user_etag(user)
         )
 
     except Exception as e:
@@ -125,14 +134,7 @@ def update_user_route(user_id):
 
         return create_response(
             message="User updated successfully",
-            data={
-                "id": user.id,
-                "name": user.name,
-                "email": user.email,
-                "social_login_provider": user.social_login_provider,
-                "profile_picture": user.profile_picture,
-                "created_at": user.created_at.isoformat(),
-            },
+            data=serialize_user(user),
         )
 
     except Exception as e:
@@ -154,27 +156,38 @@ def delete_user_route(user_id):
 @user_bp.route("/<int:user_id>/profile-picture", methods=["POST"])
 def upload_profile_picture(user_id):
     try:
-        if "file" not in request.files:
-            return create_response(
-                message="No file provided", status=HTTPStatus.BAD_REQUEST
-            )
-
-        file = request.files["file"]
-        if file.filename == "":
-            return create_response(
-                message="No selected file", status=HTTPStatus.BAD_REQUEST
-            )
-
-        if not allowed_file(file.filename):
-            return create_response(
-                message="File type not allowed", status=HTTPStatus.BAD_REQUEST
-            )
-
-        file_path = UserService.upload_profile_picture(user_id, file)
-        if file_path:
+        if request.mimetype in IMAGE_MIMETYPES:
+            stream = request.stream
+        else:
+            if "file" not in request.files:
+                return create_response(
+                    message="No file provided", status=HTTPStatus.BAD_REQUEST
+                )
+
+            file = request.files["file"]
+            if file.filename == "":
+                return create_response(
+                    message="No selected file", status=HTTPStatus.BAD_REQUEST
+                )
+
+            if not allowed_file(file.filename):
+                return create_response(
+                    message="File type not allowed", status=HTTPStatus.BAD_REQUEST
+                )
+            stream = file.stream
+
+        try:
+            key = UserService.upload_profile_picture(user_id, stream)
+        except ValueError as e:
+            return create_response(message=str(e), status=HTTPStatus.BAD_REQUEST)
+
+        if key:
             return create_response(
                 message="Profile picture uploaded successfully",
-                data={"profile_picture_path": file_path},
+                data={
+                    "profile_picture_path": key,
+                    "url": url_for("user.get_profile_picture", key=key),
+                },
             )
 
         return create_response(
@@ -185,6 +198,30 @@ def upload_profile_picture(user_id):
         return create_response(message=str(e), status=HTTPStatus.INTERNAL_SERVER_ERROR)
 
 
+@user_bp.route("/profile-pictures/<key>", methods=["GET"])
+def get_profile_picture(key):
+    try:
+        size = request.args.get("size", type=int)
+        path, immutable = UserService.media.resolve(key, size)
+    except ValueError as e:
+        return create_response(message=str(e), status=HTTPStatus.BAD_REQUEST)
+
+    if not path:
+        return create_response(message="Image not found", status=HTTPStatus.NOT_FOUND)
+
+    etag = (f"{key}-{size}" if size else key) if immutable else False
+    response = send_file(
+        os.path.abspath(path),
+        conditional=True,
+        etag=etag,
+        max_age=MediaConfig.cache_max_age if immutable else 60,
+    )
+    if immutable:
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    return response
+
+
 @user_bp.route("/email/<email>", methods=["GET"])
 def get_user_by_email(email):
     try:
@@ -194,16 +231,64 @@ def get_user_by_email(email):
                 message="User not found", status=HTTPStatus.NOT_FOUND
             )
 
+        return conditional_json_response(
+            {"data": serialize_user(user)}, user_etag(user)
+        )
+
+    except Exception as e:
+        return create_response(message=str(e), status=HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+@user_bp.route("/bulk", methods=["POST"])
+def bulk_import_users():
+    on_conflict = request.args.get("on_conflict", "update")
+    if on_conflict not in ("update", "skip"):
         return create_response(
-            data={
-                "id": user.id,
-                "name": user.name,
-                "email": user.email,
-                "social_login_provider": user.social_login_provider,
-                "profile_picture": user.profile_picture,
-                "created_at": user.created_at.isoformat(),
-            }
+            message="on_conflict must be 'update' or 'skip'",
+            status=HTTPStatus.BAD_REQUEST,
         )
 
+    try:
+        records = iter_records(request.stream, request.mimetype)
+    except ValueError as e:
+        return create_response(message=str(e), status=HTTPStatus.BAD_REQUEST)
+
+    summary = Counter()
+
+    def results():
+        for result in UserService.bulk_upsert_users(records, on_conflict=on_conflict):
+            summary[result["status"]] += 1
+            yield result
+
+    return stream_list_response(
+        "results", results(), lambda result: result, extra=lambda: {"summary": summary}
+    )
+
+
+@user_bp.route("/bulk-delete", methods=["POST"])
+def bulk_delete_users():
+    try:
+        data = request.get_json(silent=True) or {}
+        ids = data.get("ids")
+        if not isinstance(ids, list) or not all(
+            isinstance(user_id, int) and not isinstance(user_id, bool)
+            for user_id in ids
+        ):
+            return create_response(
+                message="ids must be a list of integers", status=HTTPStatus.BAD_REQUEST
+            )
+        if len(ids) > BulkUserConfig.max_delete_ids:
+            return create_response(
+                message=f"At most {BulkUserConfig.max_delete_ids} ids per request",
+                status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        return create_response(data=UserService.bulk_delete_users(ids))
+
     except Exception as e:
         return create_response(message=str(e), status=HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+@user_bp.route("/cache-stats", methods=["GET"])
+def get_user_cache_stats():
+    return create_response(data=UserService.cache_stats())
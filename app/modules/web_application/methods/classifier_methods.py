@@ -0,0 +1,167 @@
+import json
+import re
+from collections import defaultdict
+
+DEFAULT_TAXONOMY = {
+    "Technology": [
+        "technology",
+        "software",
+        "saas",
+        "cloud",
+        "artificial intelligence",
+        "machine learning",
+        "cybersecurity",
+        "developer",
+        "api",
+    ],
+    "Finance": [
+        "finance",
+        "fintech",
+        "banking",
+        "investment",
+        "insurance",
+        "payments",
+        "asset management",
+        "lending",
+    ],
+    "Healthcare": [
+        "healthcare",
+        "hospital",
+        "clinic",
+        "medical",
+        "pharmaceutical",
+        "biotech",
+        "patient",
+        "telehealth",
+    ],
+    "Education": [
+        "education",
+        "edtech",
+        "university",
+        "school",
+        "courses",
+        "e-learning",
+        "curriculum",
+        "students",
+    ],
+    "Marketing": [
+        "marketing",
+        "advertising",
+        "seo",
+        "branding",
+        "social media",
+        "campaign",
+        "lead generation",
+    ],
+    "Engineering": [
+        "engineering",
+        "manufacturing",
+        "construction",
+        "mechanical",
+        "civil engineering",
+        "industrial",
+        "automation",
+    ],
+}
+
+
+def load_taxonomy(path=None):
+    if not path:
+        return DEFAULT_TAXONOMY
+    with open(path, encoding="utf-8") as taxonomy_file:
+        return json.load(taxonomy_file)
+
+
+def _normalize_keyword(keyword):
+    return " ".join(keyword.lower().split())
+
+
+def _quote(char):
+    return r"\s+" if char == " " else re.escape(char)
+
+
+def _trie_pattern(node):
+    if "" in node and len(node) == 1:
+        return None
+
+    alternatives = []
+    single_chars = []
+    for char in sorted(key for key in node if key):
+        child = _trie_pattern(node[char])
+        if child is None:
+            single_chars.append(_quote(char))
+        else:
+            alternatives.append(_quote(char) + child)
+
+    only_chars = not alternatives
+    if len(single_chars) == 1:
+        alternatives.append(single_chars[0])
+    elif single_chars:
+        alternatives.append("(?:" + "|".join(single_chars) + ")")
+
+    pattern = (
+        alternatives[0]
+        if len(alternatives) == 1
+        else "(?:" + "|".join(alternatives) + ")"
+    )
+    if "" in node:
+        pattern = pattern + "?" if only_chars else f"(?:{pattern})?"
+    return pattern
+
+
+class IndustryClassifier:
+    def __init__(self, taxonomy=None):
+        self.taxonomy = taxonomy or DEFAULT_TAXONOMY
+        self.keywords = defaultdict(list)
+        for industry, keywords in self.taxonomy.items():
+            weights = (
+                dict(keywords)
+                if isinstance(keywords, dict)
+                else dict.fromkeys(keywords, 1)
+            )
+            normalized_weights = {}
+            for keyword, weight in weights.items():
+                normalized = _normalize_keyword(keyword)
+                if normalized:
+                    normalized_weights.setdefault(normalized, float(weight))
+            normalized_weights.setdefault(_normalize_keyword(industry), 1.0)
+            for keyword, weight in normalized_weights.items():
+                self.keywords[keyword].append((industry, weight))
+
+        trie = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        body = _trie_pattern(trie) if trie else None
+        self.pattern = (
+            re.compile(rf"(?<!\w){body}(?!\w)", re.IGNORECASE) if body else None
+        )
+
+    @classmethod
+    def from_path(cls, path=None):
+        return cls(load_taxonomy(path))
+
+    def scores(self, text):
+        scores = defaultdict(float)
+        if not text or self.pattern is None:
+            return scores
+        for match in self.pattern.finditer(text):
+            keyword = _normalize_keyword(match.group())
+            for industry, weight in self.keywords.get(keyword, ()):
+                scores[industry] += weight
+        return scores
+
+    def classify(self, text, top_n=5):
+        scores = self.scores(text)
+        total = sum(scores.values())
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            {
+                "industry": industry,
+                "score": score,
+                "confidence": round(score / total, 4) if total else 0.0,
+            }
+            for industry, score in ranked[:top_n]
+        ]
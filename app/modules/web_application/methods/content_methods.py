@@ -0,0 +1,79 @@
+import threading
+import zlib
+
+from sqlalchemy.exc import IntegrityError
+
+from app.config.config import ContentConfig
+from app.modules.web_application.models.models import db, ScrapedContent
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CONTENT_ENCODINGS = {"zstd": "zstd", "zlib": "deflate"}
+
+_local = threading.local()
+
+
+def default_codec():
+    if ContentConfig.codec == "zstd" and zstandard is not None:
+        return "zstd"
+    return "zlib"
+
+
+def compress(raw, codec):
+    if codec == "zstd":
+        compressor = getattr(_local, "zstd", None)
+        if compressor is None:
+            compressor = _local.zstd = zstandard.ZstdCompressor(
+                level=ContentConfig.zstd_level
+            )
+        return compressor.compress(raw)
+    return zlib.compress(raw, ContentConfig.zlib_level)
+
+
+def decompress(codec, data):
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd content")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class ContentStore:
+    @staticmethod
+    def put(text: str, content_hash: str) -> ScrapedContent:
+        blob = ScrapedContent.query.filter_by(content_hash=content_hash).first()
+        if blob is not None:
+            return blob
+
+        raw = text.encode("utf-8")
+        codec = default_codec()
+        data = compress(raw, codec)
+        blob = ScrapedContent(
+            content_hash=content_hash,
+            codec=codec,
+            size=len(raw),
+            stored_size=len(data),
+            data=data,
+        )
+        try:
+            with db.session.begin_nested():
+                db.session.add(blob)
+        except IntegrityError:
+            blob = ScrapedContent.query.filter_by(content_hash=content_hash).one()
+        return blob
+
+    @staticmethod
+    def blob(scrape):
+        source = scrape.canonical if scrape.canonical_id else scrape
+        return source.content_blob if source.content_id else None
+
+    @staticmethod
+    def text(scrape):
+        blob = ContentStore.blob(scrape)
+        if blob is None:
+            source = scrape.canonical if scrape.canonical_id else scrape
+            return source.content
+        return decompress(blob.codec, blob.data).decode("utf-8")
@@ -0,0 +1,297 @@
+import hashlib
+import heapq
+import itertools
+import math
+import posixpath
+import re
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, wait
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from app.config.config import CrawlConfig
+from app.modules.web_application.methods.fetch_cache_methods import FetchCacheService
+from app.modules.web_application.methods.scrape_store_methods import (
+    ScrapeStoreService,
+)
+from app.modules.web_application.methods.whois_methods import registrable_domain
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+TRACKING_PARAMS = re.compile(
+    r"^(utm_\w+|gclid|fbclid|msclkid|mc_cid|mc_eid|_ga|_hsenc|_hsmi)$", re.IGNORECASE
+)
+SKIP_EXTENSIONS = frozenset(
+    {
+        ".css",
+        ".js",
+        ".json",
+        ".xml",
+        ".rss",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".ppt",
+        ".pptx",
+        ".zip",
+        ".gz",
+        ".tar",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".svg",
+        ".webp",
+        ".ico",
+        ".mp3",
+        ".mp4",
+        ".mov",
+        ".avi",
+        ".woff",
+        ".woff2",
+    }
+)
+PROFILE_PAGES = re.compile(
+    r"about|company|contact|team|leadership|people|who-we-are|mission|careers",
+    re.IGNORECASE,
+)
+
+
+def remove_dot_segments(path):
+    segments = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if len(segments) > 1:
+                segments.pop()
+        elif segment != ".":
+            segments.append(segment)
+    if path.endswith(("/.", "/..")):
+        segments.append("")
+    return "/".join(segments)
+
+
+def normalize_url(url, base=None):
+    try:
+        parts = urlsplit(urljoin(base or url, url.strip()))
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if scheme not in DEFAULT_PORTS or not host:
+        return None
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+    path = remove_dot_segments(re.sub(r"/{2,}", "/", parts.path)) or "/"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not TRACKING_PARAMS.match(key)
+        )
+    )
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = capacity
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item):
+        added = False
+        for position in self._positions(item):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self):
+        return self.count
+
+
+class CompanyProfile:
+    def __init__(self, seed_url):
+        self.seed_url = seed_url
+        self.domain = registrable_domain(seed_url)
+        self.names = Counter()
+        self.industries = Counter()
+        self.emails = {}
+        self.contacts = {}
+        self.about = ("", (False, 0))
+        self.description = ""
+        self.title = ""
+        self.domain_info = None
+        self.pages = []
+
+    def add(self, url, data, depth):
+        self.pages.append(
+            {
+                "url": url,
+                "depth": depth,
+                "title": data.get("title"),
+                "page_content_type": data.get("page_content_type"),
+            }
+        )
+        if data.get("name"):
+            self.names[data["name"]] += 3 if depth == 0 else 1
+        for industry in data.get("industry_scores") or ():
+            self.industries[industry["industry"]] += industry["score"]
+        if data.get("email"):
+            self.emails.setdefault(data["email"], None)
+        if data.get("contact"):
+            self.contacts.setdefault(data["contact"], None)
+
+        about = data.get("about")
+        if about:
+            rank = (bool(PROFILE_PAGES.search(urlsplit(url).path)), len(about))
+            if rank > self.about[1]:
+                self.about = (about, rank)
+        if data.get("title") and (depth == 0 or not self.title):
+            self.title = data["title"]
+        if data.get("description") and (depth == 0 or not self.description):
+            self.description = data["description"]
+        if self.domain_info is None:
+            self.domain_info = data.get("domain_info")
+
+    def result(self):
+        total = sum(self.industries.values())
+        industries = [
+            {
+                "industry": industry,
+                "score": score,
+                "confidence": round(score / total, 4) if total else 0.0,
+            }
+            for industry, score in self.industries.most_common(5)
+        ]
+        return {
+            "url": self.seed_url,
+            "domain": self.domain,
+            "name": self.names.most_common(1)[0][0] if self.names else self.title,
+            "description": self.description,
+            "about": self.about[0],
+            "industry": industries[0]["industry"] if industries else "Unknown",
+            "industry_scores": industries,
+            "emails": list(self.emails),
+            "contacts": list(self.contacts),
+            "domain_info": self.domain_info,
+            "pages": self.pages,
+        }
+
+
+class SiteCrawler:
+    def __init__(
+        self, scraper, scheduler, max_depth=None, max_pages=None, in_flight=None
+    ):
+        self.scraper = scraper
+        self.scheduler = scheduler
+        self.max_depth = CrawlConfig.max_depth if max_depth is None else max_depth
+        self.max_pages = max_pages or CrawlConfig.max_pages
+        self.in_flight = in_flight or CrawlConfig.in_flight
+
+    def follow(self, url, domain):
+        if registrable_domain(url) != domain:
+            return False
+        extension = posixpath.splitext(urlsplit(url).path)[1].lower()
+        return extension not in SKIP_EXTENSIONS
+
+    def priority(self, url):
+        return 0 if PROFILE_PAGES.search(urlsplit(url).path) else 1
+
+    def crawl(self, user_id, seed_url):
+        seed = normalize_url(seed_url) if isinstance(seed_url, str) else None
+        if seed is None:
+            raise ValueError("Invalid URL")
+
+        domain = registrable_domain(seed)
+        seen = BloomFilter(CrawlConfig.bloom_capacity, CrawlConfig.bloom_error_rate)
+        frontier = []
+        order = itertools.count()
+        profile = CompanyProfile(seed)
+        pending = {}
+        scheduled = stored = failed = 0
+
+        def enqueue(url, depth):
+            if len(frontier) < CrawlConfig.max_frontier and seen.add(url):
+                heapq.heappush(frontier, (depth, self.priority(url), next(order), url))
+
+        enqueue(seed, 0)
+        try:
+            while frontier or pending:
+                while (
+                    frontier
+                    and len(pending) < self.in_flight
+                    and scheduled < self.max_pages
+                ):
+                    depth, _, _, url = heapq.heappop(frontier)
+                    future = self.scheduler.submit(url, self.scraper.scrape_url, url)
+                    pending[future] = (url, depth)
+                    scheduled += 1
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, depth = pending.pop(future)
+                    try:
+                        data = future.result()
+                        entry = FetchCacheService.get(url)
+                        scrape = ScrapeStoreService.store(
+                            user_id, url, data, entry.scraped_data if entry else None
+                        )
+                    except Exception as e:
+                        failed += 1
+                        yield {
+                            "event": "error",
+                            "url": url,
+                            "depth": depth,
+                            "error": str(e),
+                        }
+                        continue
+
+                    stored += 1
+                    profile.add(url, data, depth)
+                    if depth < self.max_depth:
+                        for link in data.get("links") or ():
+                            link = normalize_url(link)
+                            if link is not None and self.follow(link, domain):
+                                enqueue(link, depth + 1)
+                    yield {
+                        "event": "page",
+                        "url": url,
+                        "depth": depth,
+                        "scrape": scrape,
+                    }
+        finally:
+            for future in pending:
+                future.cancel()
+
+        yield {
+            "event": "profile",
+            "profile": profile.result(),
+            "stats": {
+                "pages": stored,
+                "errors": failed,
+                "seen": len(seen),
+                "frontier": len(frontier),
+            },
+        }
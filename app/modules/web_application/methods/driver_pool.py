@@ -0,0 +1,125 @@
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPoolTimeout(Exception):
+    pass
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+
+class WebDriverPool:
+    def __init__(self, factory, size, warm_size=0, max_pages=50, checkout_timeout=30):
+        self.factory = factory
+        self.size = max(1, size)
+        self.warm_size = min(warm_size, self.size)
+        self.max_pages = max_pages
+        self.checkout_timeout = checkout_timeout
+        self._idle = deque()
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def warm_up(self, background=True):
+        if background:
+            threading.Thread(target=self._fill_idle, daemon=True).start()
+        else:
+            self._fill_idle()
+
+    def _fill_idle(self):
+        while True:
+            with self._cond:
+                if (
+                    self._closed
+                    or len(self._idle) >= self.warm_size
+                    or self._created >= self.size
+                ):
+                    return
+                self._created += 1
+            try:
+                pooled = _PooledDriver(self.factory())
+            except Exception:
+                with self._cond:
+                    self._created -= 1
+                    self._cond.notify()
+                return
+            with self._cond:
+                self._idle.append(pooled)
+                self._cond.notify()
+
+    def checkout(self):
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                if not self._cond.wait(self.checkout_timeout):
+                    raise DriverPoolTimeout("Timed out waiting for a browser")
+        try:
+            return _PooledDriver(self.factory())
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def checkin(self, pooled, broken=False):
+        pooled.pages += 1
+        retire = broken or self._closed or pooled.pages >= self.max_pages
+        if not retire:
+            with self._cond:
+                self._idle.append(pooled)
+                self._cond.notify()
+            return
+        self._discard(pooled)
+        self.warm_up()
+
+    def _discard(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self):
+        pooled = self.checkout()
+        broken = False
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.checkin(pooled, broken=broken)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._created - len(self._idle),
+            }
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
@@ -0,0 +1,288 @@
+import codecs
+import re
+
+import lxml.html
+from lxml import etree
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+DECLARED_CHARSET = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_.:-]+)""", re.IGNORECASE
+)
+SNIFF_BYTES = 1024
+DETECT_BYTES = 16384
+SKIP_TEXT_TAGS = frozenset({"script", "style", "template", "noscript"})
+SPA_ROOT_IDS = frozenset({"root", "app", "__next", "__nuxt", "svelte"})
+
+
+def sniff_encoding(html):
+    match = DECLARED_CHARSET.search(html[:SNIFF_BYTES])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            pass
+
+    prefix = html[:DETECT_BYTES]
+    try:
+        prefix.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        if len(html) > DETECT_BYTES and e.start >= len(prefix) - 3:
+            return "utf-8"
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(prefix).best()
+        if best is not None:
+            return codecs.lookup(best.encoding).name
+    return "cp1252"
+
+
+class ExtractionRule:
+    tags = None
+
+    def initial(self):
+        return {}
+
+    def start(self, element, state):
+        return False
+
+    def captured(self, element, text, state):
+        pass
+
+    def result(self, state):
+        return {}
+
+
+class TitleRule(ExtractionRule):
+    tags = frozenset({"title"})
+
+    def start(self, element, state):
+        return "title" not in state
+
+    def captured(self, element, text, state):
+        state["title"] = text.strip()
+
+    def result(self, state):
+        return {"title": state.get("title", "")}
+
+
+class MetaRule(ExtractionRule):
+    tags = frozenset({"meta"})
+
+    def start(self, element, state):
+        content = element.get("content")
+        if content is None:
+            return False
+        if element.get("name", "").lower() == "description":
+            state.setdefault("description", content)
+        elif element.get("property", "").lower() == "og:title":
+            state.setdefault("name", content)
+        return False
+
+    def result(self, state):
+        return {
+            "description": state.get("description", ""),
+            "name": state.get("name", ""),
+        }
+
+
+class AboutRule(ExtractionRule):
+    tags = frozenset({"div", "p"})
+    pattern = re.compile(r"about|description|bio", re.IGNORECASE)
+    max_length = 500
+
+    def initial(self):
+        return {"parts": [], "length": 0}
+
+    def start(self, element, state):
+        if state["length"] >= self.max_length:
+            return False
+        return bool(self.pattern.search(element.get("class", "")))
+
+    def captured(self, element, text, state):
+        state["parts"].append(text)
+        state["length"] += len(text) + 1
+
+    def result(self, state):
+        return {"about": " ".join(state["parts"])[: self.max_length]}
+
+
+class ContactRule(ExtractionRule):
+    tags = frozenset({"a"})
+    pattern = re.compile(r"tel:|contact", re.IGNORECASE)
+
+    def start(self, element, state):
+        href = element.get("href")
+        if "contact" not in state and href and self.pattern.search(href):
+            state["contact"] = href
+        return False
+
+    def result(self, state):
+        return {"contact": state.get("contact", "")}
+
+
+class LinkRule(ExtractionRule):
+    tags = frozenset({"a", "base"})
+    skip_prefixes = ("#", "mailto:", "tel:", "javascript:", "data:")
+    max_links = 500
+
+    def initial(self):
+        return {"links": {}, "base": None}
+
+    def start(self, element, state):
+        href = (element.get("href") or "").strip()
+        if not href:
+            return False
+        if element.tag == "base":
+            if state["base"] is None:
+                state["base"] = href
+        elif (
+            len(state["links"]) < self.max_links
+            and not href.lower().startswith(self.skip_prefixes)
+            and "nofollow" not in element.get("rel", "").lower().split()
+        ):
+            state["links"].setdefault(href, None)
+        return False
+
+    def result(self, state):
+        return {"links": list(state["links"]), "base_href": state["base"]}
+
+
+class PageTypeRule(ExtractionRule):
+    tags = frozenset({"article", "profile", "form"})
+    page_types = (
+        ("article", "Blog/Article"),
+        ("profile", "Profile Page"),
+        ("form", "Contact/Landing Page"),
+    )
+
+    def start(self, element, state):
+        state[element.tag] = True
+        return False
+
+    def result(self, state):
+        for tag, page_type in self.page_types:
+            if state.get(tag):
+                return {"page_content_type": page_type}
+        return {"page_content_type": "General Website"}
+
+
+class RenderHintRule(ExtractionRule):
+    tags = frozenset({"noscript", "div", "body"})
+
+    def initial(self):
+        return {"noscript_length": 0, "empty_spa_root": False, "has_body": False}
+
+    def start(self, element, state):
+        if element.tag == "body":
+            state["has_body"] = True
+        elif element.tag == "noscript":
+            state["noscript_length"] += len(element.text_content().strip())
+        elif element.get("id") in SPA_ROOT_IDS:
+            return True
+        return False
+
+    def captured(self, element, text, state):
+        if not text.strip():
+            state["empty_spa_root"] = True
+
+    def result(self, state):
+        return dict(state)
+
+
+DEFAULT_RULES = (
+    TitleRule,
+    MetaRule,
+    AboutRule,
+    ContactRule,
+    LinkRule,
+    PageTypeRule,
+    RenderHintRule,
+)
+
+
+class ExtractionEngine:
+    def __init__(self, rules=None):
+        self.rules = []
+        self._tag_rules = {}
+        self._any_tag_rules = []
+        for rule in rules or [rule_class() for rule_class in DEFAULT_RULES]:
+            self.register(rule)
+
+    def register(self, rule):
+        index = len(self.rules)
+        self.rules.append(rule)
+        if rule.tags is None:
+            self._any_tag_rules.append(index)
+        else:
+            for tag in rule.tags:
+                self._tag_rules.setdefault(tag, []).append(index)
+        return rule
+
+    def parse(self, html):
+        if isinstance(html, str):
+            html = html.encode("utf-8", "replace")
+        else:
+            if html.startswith(codecs.BOM_UTF8):
+                html = html[len(codecs.BOM_UTF8) :]
+            encoding = sniff_encoding(html)
+            if encoding != "utf-8":
+                html = html.decode(encoding, "replace").encode("utf-8")
+        if not html.strip():
+            return None
+        parser = lxml.html.HTMLParser(
+            encoding="utf-8", remove_comments=True, remove_pis=True
+        )
+        try:
+            return lxml.html.document_fromstring(html, parser=parser)
+        except (etree.ParserError, ValueError):
+            return None
+
+    def extract(self, html):
+        root = self.parse(html)
+        states = [rule.initial() for rule in self.rules]
+        text_parts = []
+
+        if root is not None:
+            self._walk(root, states, text_parts)
+
+        fields = {}
+        for rule, state in zip(self.rules, states):
+            fields.update(rule.result(state))
+        fields["text"] = "".join(text_parts)
+        return fields
+
+    def _walk(self, root, states, text_parts):
+        rules = self.rules
+        captures = []
+        skip_depth = 0
+
+        for event, element in etree.iterwalk(root, events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                position = len(text_parts)
+                for index in self._tag_rules.get(tag, ()):
+                    if rules[index].start(element, states[index]):
+                        captures.append((element, index, position))
+                for index in self._any_tag_rules:
+                    if rules[index].start(element, states[index]):
+                        captures.append((element, index, position))
+
+                if tag in SKIP_TEXT_TAGS:
+                    skip_depth += 1
+                elif not skip_depth and element.text:
+                    text_parts.append(element.text)
+                continue
+
+            while captures and captures[-1][0] is element:
+                _, index, position = captures.pop()
+                rules[index].captured(
+                    element, "".join(text_parts[position:]), states[index]
+                )
+            if tag in SKIP_TEXT_TAGS:
+                skip_depth -= 1
+            if not skip_depth and element.tail:
+                text_parts.append(element.tail)
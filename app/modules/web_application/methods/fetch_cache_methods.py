@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
+from app.modules.web_application.models.models import db, UrlFetchCache
+
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class FetchCacheService:
+    @staticmethod
+    def get(url: str) -> Optional[UrlFetchCache]:
+        return UrlFetchCache.query.filter_by(url=url).first()
+
+    @staticmethod
+    def is_fresh(entry: UrlFetchCache, max_age: Optional[int]) -> bool:
+        if max_age is None or entry.fetched_at is None:
+            return False
+        return entry.fetched_at >= datetime.utcnow() - timedelta(seconds=max_age)
+
+    @staticmethod
+    def validators(entry: Optional[UrlFetchCache]) -> dict:
+        if entry is None or entry.scraped_data_id is None:
+            return {}
+        return {"etag": entry.etag, "last_modified": entry.last_modified}
+
+    @staticmethod
+    def record(
+        url: str, validators: dict, content_hash: str, scraped_data_id: int
+    ) -> UrlFetchCache:
+        values = {
+            "etag": validators.get("etag"),
+            "last_modified": validators.get("last_modified"),
+            "content_hash": content_hash,
+            "scraped_data_id": scraped_data_id,
+            "fetched_at": datetime.utcnow(),
+        }
+        dialect_insert = UPSERT_DIALECTS.get(db.engine.dialect.name)
+        try:
+            if dialect_insert is None:
+                FetchCacheService._merge(url, values)
+            else:
+                statement = dialect_insert(UrlFetchCache.__table__).values(
+                    url=url, **values
+                )
+                db.session.execute(
+                    statement.on_conflict_do_update(index_elements=["url"], set_=values)
+                )
+                db.session.commit()
+            return FetchCacheService.get(url)
+        except Exception:
+            db.session.rollback()
+            raise
+
+    @staticmethod
+    def _merge(url: str, values: dict) -> None:
+        entry = FetchCacheService.get(url)
+        if entry is None:
+            try:
+                with db.session.begin_nested():
+                    db.session.add(UrlFetchCache(url=url, **values))
+                db.session.commit()
+                return
+            except IntegrityError:
+                entry = FetchCacheService.get(url)
+        for key, value in values.items():
+            setattr(entry, key, value)
+        db.session.commit()
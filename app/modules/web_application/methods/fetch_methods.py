@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RATE_LIMIT_STATUSES = (429, 503)
+
+
+class RateLimited(Exception):
+    def __init__(self, url, status, retry_after=None):
+        super().__init__(f"{url} answered {status}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HttpFetcher:
+    def __init__(self, pool_size=32, timeout=10):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(
+            {
+                "User-Agent": "Mozilla/5.0 (compatible; IDEHScraper/1.0)",
+                "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+            }
+        )
+
+    def fetch(self, url, validators=None):
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        result = {
+            "status": response.status_code,
+            "html": None,
+            "validators": {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            },
+        }
+        if response.status_code in RATE_LIMIT_STATUSES:
+            result["retry_after"] = parse_retry_after(
+                response.headers.get("Retry-After")
+            )
+            return result
+
+        if response.status_code == 304:
+            result["validators"] = {
+                "etag": result["validators"]["etag"] or validators.get("etag"),
+                "last_modified": result["validators"]["last_modified"]
+                or validators.get("last_modified"),
+            }
+            return result
+
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code == 200 and "html" in content_type.lower():
+            if "charset" in content_type.lower():
+                result["html"] = response.text
+            else:
+                result["html"] = response.content
+        return result
+
+
+def needs_browser(page, min_text_length=200):
+    if not page["has_body"] or page["empty_spa_root"]:
+        return True
+
+    text_length = len(page["text"].strip())
+    if text_length < min_text_length:
+        return True
+    if page["noscript_length"] * 2 >= text_length:
+        return True
+
+    return not page["title"] and not page["description"]
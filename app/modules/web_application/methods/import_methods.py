@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+
+USER_IMPORT_FIELDS = ("name", "email", "social_login_provider", "profile_picture")
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-seq")
+CSV_TYPES = ("text/csv", "application/csv")
+
+
+def iter_raw_lines(stream, chunk_size=65536):
+    buffer = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        yield from lines
+    if buffer:
+        yield buffer
+
+
+def iter_ndjson(stream):
+    for line in iter_raw_lines(stream):
+        line = line.strip().lstrip(b"\x1e")
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield ValueError(f"Invalid JSON: {e}")
+
+
+def iter_csv(stream):
+    yield from csv.DictReader(
+        io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    )
+
+
+def iter_json_array(stream):
+    payload = json.load(io.TextIOWrapper(stream, encoding="utf-8-sig"))
+    if isinstance(payload, dict):
+        payload = payload.get("users")
+    if not isinstance(payload, list):
+        raise ValueError("Expected a JSON array of users")
+    return payload
+
+
+def guard_stream(records):
+    try:
+        yield from records
+    except (ValueError, csv.Error) as e:
+        yield ValueError(f"Unreadable input, import stopped: {e}")
+
+
+def iter_records(stream, mimetype):
+    if mimetype in NDJSON_TYPES:
+        return guard_stream(iter_ndjson(stream))
+    if mimetype in CSV_TYPES:
+        return guard_stream(iter_csv(stream))
+    return iter_json_array(stream)
+
+
+def clean_user_record(record):
+    if isinstance(record, Exception):
+        raise record
+    if not isinstance(record, dict):
+        raise ValueError("Expected an object")
+    cleaned = {}
+    for field in USER_IMPORT_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            value = value.strip() or None
+        cleaned[field] = value
+    missing = [field for field in ("name", "email") if not cleaned[field]]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+    if "@" not in cleaned["email"]:
+        raise ValueError("Invalid email")
+    return cleaned
@@ -0,0 +1,291 @@
+from collections import deque
+from datetime import datetime, timedelta
+import threading
+
+import validators
+from sqlalchemy import update
+
+from app.config.config import JobConfig
+from app.modules.web_application.models.models import (
+    app,
+    db,
+    ScrapeJob,
+    ScrapeJobItem,
+)
+from app.modules.web_application.methods.fetch_methods import RateLimited
+from app.modules.web_application.methods.scheduler_methods import (
+    HostScheduler,
+    RobotsDisallowed,
+    host_key,
+)
+from app.modules.web_application.methods.scrape_store_methods import (
+    ScrapeStoreService,
+)
+
+
+class ScrapeJobService:
+    @staticmethod
+    def create_job(user_id: int, urls: list) -> ScrapeJob:
+        unique_urls = list(
+            dict.fromkeys(
+                url.strip() for url in urls if isinstance(url, str) and url.strip()
+            )
+        )
+        now = datetime.utcnow()
+        rows = []
+        failed = 0
+        for url in unique_urls:
+            if validators.url(url):
+                rows.append({"url": url, "status": "pending", "attempts": 0})
+            else:
+                failed += 1
+                rows.append(
+                    {
+                        "url": url,
+                        "status": "failed",
+                        "attempts": 0,
+                        "error": "Invalid URL",
+                        "finished_at": now,
+                    }
+                )
+
+        job = ScrapeJob(
+            created_by_user_id=user_id,
+            total=len(rows),
+            failed=failed,
+            status="completed" if failed == len(rows) else "pending",
+        )
+        try:
+            db.session.add(job)
+            db.session.flush()
+            for row in rows:
+                row["job_id"] = job.id
+            db.session.bulk_insert_mappings(ScrapeJobItem, rows)
+            db.session.commit()
+            return job
+        except Exception:
+            db.session.rollback()
+            raise
+
+    @staticmethod
+    def get_job(job_id: int, user_id: int):
+        return ScrapeJob.query.filter_by(id=job_id, created_by_user_id=user_id).first()
+
+    @staticmethod
+    def job_status(job: ScrapeJob, offset: int = 0, limit: int = 100) -> dict:
+        items = job.items.offset(offset).limit(limit).all()
+        done = job.completed + job.failed
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "total": job.total,
+            "completed": job.completed,
+            "failed": job.failed,
+            "progress": round(done / job.total, 4) if job.total else 1.0,
+            "created_at": job.created_at.isoformat(),
+            "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+            "results": [
+                {
+                    "url": item.url,
+                    "status": item.status,
+                    "scraped_data_id": item.scraped_data_id,
+                    "error": item.error,
+                }
+                for item in items
+            ],
+        }
+
+
+class ScrapeJobWorker:
+    def __init__(self, scraper, concurrency=None, flask_app=None):
+        self.scraper = scraper
+        self.concurrency = concurrency or JobConfig.worker_concurrency
+        self.flask_app = flask_app or app
+        self.scheduler = HostScheduler(concurrency=self.concurrency, max_retries=0)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+    def run_forever(self):
+        with self.flask_app.app_context():
+            self.recover_stale_items()
+        while not self._stop.is_set():
+            if not self.run_once():
+                self._wake.wait(JobConfig.poll_interval)
+                self._wake.clear()
+
+    def run_once(self) -> int:
+        with self._lock:
+            free = self.concurrency - self._in_flight
+        if free <= 0:
+            return 0
+
+        with self.flask_app.app_context():
+            item_ids = self.claim_items(min(free, JobConfig.claim_size))
+            if not item_ids:
+                self.recover_stale_items()
+            urls = dict(
+                db.session.query(ScrapeJobItem.id, ScrapeJobItem.url).filter(
+                    ScrapeJobItem.id.in_(item_ids)
+                )
+            )
+
+        for item_id in item_ids:
+            with self._lock:
+                self._in_flight += 1
+            future = self.scheduler.submit(urls[item_id], self._run_item, item_id)
+            future.add_done_callback(
+                lambda future, item_id=item_id: self._item_done(item_id, future)
+            )
+        return len(item_ids)
+
+    def interleave_hosts(self, candidates, limit: int) -> list:
+        by_host = {}
+        for item_id, url in candidates:
+            if not self.scheduler.saturated(url):
+                by_host.setdefault(host_key(url), deque()).append(item_id)
+        ordered = []
+        queues = deque(by_host.values())
+        while queues and len(ordered) < limit:
+            queue = queues.popleft()
+            ordered.append(queue.popleft())
+            if queue:
+                queues.append(queue)
+        return ordered
+
+    def claim_items(self, limit: int) -> list:
+        candidate_ids = self.interleave_hosts(
+            db.session.query(ScrapeJobItem.id, ScrapeJobItem.url)
+            .filter_by(status="pending")
+            .order_by(ScrapeJobItem.id)
+            .limit(limit * JobConfig.claim_window),
+            limit,
+        )
+        now = datetime.utcnow()
+        claimed = []
+        try:
+            for item_id in candidate_ids:
+                result = db.session.execute(
+                    update(ScrapeJobItem)
+                    .where(
+                        ScrapeJobItem.id == item_id, ScrapeJobItem.status == "pending"
+                    )
+                    .values(
+                        status="running",
+                        claimed_at=now,
+                        attempts=ScrapeJobItem.attempts + 1,
+                    )
+                )
+                if result.rowcount == 1:
+                    claimed.append(item_id)
+            if claimed:
+                db.session.execute(
+                    update(ScrapeJob)
+                    .where(
+                        ScrapeJob.id.in_(
+                            db.session.query(ScrapeJobItem.job_id).filter(
+                                ScrapeJobItem.id.in_(claimed)
+                            )
+                        ),
+                        ScrapeJob.status == "pending",
+                    )
+                    .values(status="running", updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+            db.session.commit()
+            return claimed
+        except Exception:
+            db.session.rollback()
+            raise
+
+    def recover_stale_items(self):
+        cutoff = datetime.utcnow() - timedelta(seconds=JobConfig.lease_seconds)
+        try:
+            db.session.execute(
+                update(ScrapeJobItem)
+                .where(
+                    ScrapeJobItem.status == "running",
+                    ScrapeJobItem.claimed_at < cutoff,
+                )
+                .values(status="pending", claimed_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+
+    def _run_item(self, item_id: int):
+        with self.flask_app.app_context():
+            self.process_item(item_id)
+
+    def _item_done(self, item_id: int, future):
+        try:
+            if not future.cancelled() and isinstance(
+                future.exception(), RobotsDisallowed
+            ):
+                with self.flask_app.app_context():
+                    item = ScrapeJobItem.query.get(item_id)
+                    if item is not None and item.status == "running":
+                        self.finish_item(item, "failed", error=str(future.exception()))
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._wake.set()
+
+    def process_item(self, item_id: int):
+        item = ScrapeJobItem.query.get(item_id)
+        if item is None or item.status != "running":
+            return
+
+        try:
+            scrape = ScrapeStoreService.scrape(
+                self.scraper, item.job.created_by_user_id, item.url
+            )
+        except Exception as e:
+            db.session.rollback()
+            if item.attempts < JobConfig.max_attempts:
+                item.status = "pending"
+                item.claimed_at = None
+                item.error = str(e)
+                db.session.commit()
+            else:
+                self.finish_item(item, "failed", error=str(e))
+            if isinstance(e, RateLimited):
+                raise
+            return
+
+        self.finish_item(item, "completed", scraped_data_id=scrape.id)
+
+    def finish_item(self, item, status, scraped_data_id=None, error=None):
+        now = datetime.utcnow()
+        counter = ScrapeJob.completed if status == "completed" else ScrapeJob.failed
+        try:
+            item.status = status
+            item.error = error
+            item.scraped_data_id = scraped_data_id
+            item.finished_at = now
+            db.session.execute(
+                update(ScrapeJob)
+                .where(ScrapeJob.id == item.job_id)
+                .values({counter: counter + 1, ScrapeJob.updated_at: now})
+                .execution_options(synchronize_session=False)
+            )
+            db.session.execute(
+                update(ScrapeJob)
+                .where(
+                    ScrapeJob.id == item.job_id,
+                    ScrapeJob.completed + ScrapeJob.failed >= ScrapeJob.total,
+                )
+                .values(status="completed")
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        self.scheduler.close()
@@ -0,0 +1,90 @@
+import atexit
+import os
+import threading
+import time
+import weakref
+
+from app.modules.web_application.methods.metrics_methods import stage
+
+resources = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for resource in list(resources):
+        resource._after_fork()
+
+
+def _close_all():
+    for resource in list(resources):
+        resource.close()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(_close_all)
+
+
+class LazyResource:
+    def __init__(self, factory, name=None):
+        self.factory = factory
+        self.name = name or getattr(factory, "__name__", "resource")
+        self.init_seconds = None
+        self._value = None
+        self._pid = None
+        self._warming = None
+        self._lock = threading.Lock()
+        self._warm_lock = threading.Lock()
+        resources.add(self)
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._warm_lock = threading.Lock()
+        self._value = None
+        self._pid = None
+        self._warming = None
+
+    @property
+    def ready(self):
+        return self._value is not None and self._pid == os.getpid()
+
+    def get(self):
+        if self.ready:
+            return self._value
+        with self._lock:
+            if self._pid != os.getpid():
+                self._value = None
+            if self._value is None:
+                started = time.perf_counter()
+                with stage(f"{self.name}_init"):
+                    self._value = self.factory()
+                self._pid = os.getpid()
+                self.init_seconds = time.perf_counter() - started
+            return self._value
+
+    def warm_up(self, background=True):
+        if self.ready:
+            return None
+        if not background:
+            self.get()
+            return None
+        with self._warm_lock:
+            if self._warming is None or not self._warming.is_alive():
+                self._warming = threading.Thread(
+                    target=self._warm, name=f"warm-{self.name}", daemon=True
+                )
+                self._warming.start()
+            return self._warming
+
+    def _warm(self):
+        try:
+            self.get()
+        except Exception:
+            pass
+
+    def close(self):
+        with self._lock:
+            value, self._value = self._value, None
+            owned = self._pid == os.getpid()
+        close = getattr(value, "close", None)
+        if owned and callable(close):
+            close()
@@ -0,0 +1,45 @@
+import hashlib
+import os
+import random
+import threading
+import time
+
+from langchain.llms import OpenAI
+
+from app.config.config import PromptConfig
+
+
+class FakeLLM:
+    def __init__(self, latency=0.0, jitter=0.0, max_words=40, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.max_words = max_words
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+        words = prompt.split()
+        step = max(1, len(words) // self.max_words)
+        return f"[{digest}] " + " ".join(words[::step][: self.max_words])
+
+    def stream(self, prompt):
+        for word in self(prompt).split(" "):
+            yield word + " "
+
+    def get_num_tokens(self, text):
+        return len(text.split())
+
+
+def create_llm(provider=None):
+    provider = provider or PromptConfig.llm_provider
+    if provider == "fake":
+        return FakeLLM(latency=PromptConfig.fake_llm_latency)
+    return OpenAI(openai_api_key=os.getenv("OPENAI_API_KEY"), temperature=0.7)
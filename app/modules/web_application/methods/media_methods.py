@@ -0,0 +1,179 @@
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app, has_app_context
+
+from app.config.config import MediaConfig
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+)
+KEY_PATTERN = re.compile(r"^([0-9a-f]{64})(\.png|\.jpg|\.gif)$")
+
+logger = logging.getLogger(__name__)
+
+
+def sniff_extension(head):
+    for signature, extension in SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    return None
+
+
+def parse_key(key):
+    match = KEY_PATTERN.match(key or "")
+    if not match:
+        raise ValueError("Invalid media key")
+    return match.group(1), match.group(2)
+
+
+def render_thumbnails(source, targets):
+    with Image.open(source) as image:
+        image_format = image.format
+        if image_format == "JPEG":
+            largest = max(size for size, _ in targets)
+            image.draft("RGB", (largest, largest))
+        image.load()
+        for size, target in sorted(targets, reverse=True):
+            thumbnail = image.copy()
+            thumbnail.thumbnail((size, size))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(target))
+            try:
+                with os.fdopen(handle, "wb") as output:
+                    thumbnail.save(output, format=image_format)
+                os.replace(temp_path, target)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+            image = thumbnail
+
+
+class MediaStore:
+    def __init__(
+        self, root=None, chunk_size=None, max_bytes=None, sizes=None, workers=None
+    ):
+        self._root = root
+        self.chunk_size = chunk_size or MediaConfig.chunk_size
+        self.max_bytes = max_bytes or MediaConfig.max_bytes
+        self.sizes = tuple(sizes or MediaConfig.thumbnail_sizes)
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers or MediaConfig.thumbnail_workers,
+            thread_name_prefix="thumbnails",
+        )
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    @property
+    def root(self):
+        if self._root:
+            return self._root
+        if has_app_context():
+            return current_app.config.get("UPLOAD_FOLDER", MediaConfig.upload_folder)
+        return MediaConfig.upload_folder
+
+    def path(self, key, size=None):
+        digest, extension = parse_key(key)
+        parts = [self.root]
+        if size:
+            parts += ["thumbs", str(size)]
+        return os.path.join(*parts, digest[:2], digest[2:4], digest + extension)
+
+    def save(self, stream):
+        root = self.root
+        incoming = os.path.join(root, "incoming")
+        os.makedirs(incoming, exist_ok=True)
+        digest = hashlib.sha256()
+        extension = None
+        written = 0
+        handle, temp_path = tempfile.mkstemp(dir=incoming)
+        try:
+            with os.fdopen(handle, "wb") as output:
+                while True:
+                    chunk = stream.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    if extension is None:
+                        extension = sniff_extension(chunk)
+                        if extension is None:
+                            raise ValueError("Unsupported image type")
+                    written += len(chunk)
+                    if written > self.max_bytes:
+                        raise ValueError(f"Image exceeds {self.max_bytes} bytes")
+                    digest.update(chunk)
+                    output.write(chunk)
+            if extension is None:
+                raise ValueError("Empty upload")
+
+            key = digest.hexdigest() + extension
+            path = self.path(key)
+            if os.path.exists(path):
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.schedule_thumbnails(key)
+        return key
+
+    def schedule_thumbnails(self, key):
+        if Image is None or not self.sizes:
+            return None
+        targets = [
+            (size, self.path(key, size))
+            for size in self.sizes
+            if not os.path.exists(self.path(key, size))
+        ]
+        if not targets:
+            return None
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self.executor.submit(
+                    render_thumbnails, self.path(key), targets
+                )
+                self._inflight[key] = future
+                future.add_done_callback(lambda done: self._thumbnails_done(key, done))
+        return future
+
+    def _thumbnails_done(self, key, future):
+        self._inflight.pop(key, None)
+        error = future.exception()
+        if error is not None:
+            logger.error(
+                "Rendering thumbnails for %s failed",
+                key,
+                exc_info=(type(error), error, error.__traceback__),
+            )
+
+    def resolve(self, key, size=None):
+        if size is not None and size not in self.sizes:
+            raise ValueError(f"size must be one of {', '.join(map(str, self.sizes))}")
+        if size:
+            thumbnail = self.path(key, size)
+            if os.path.exists(thumbnail):
+                return thumbnail, True
+        path = self.path(key)
+        if os.path.exists(path):
+            return path, size is None
+        return None, False
+
+    def close(self):
+        self.executor.shutdown(wait=True)
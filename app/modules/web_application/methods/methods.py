@@ -1,15 +1,51 @@
 from datetime import datetime
-from werkzeug.utils import secure_filename
-import os
-from typing import Optional, List
-from sqlalchemy.exc import IntegrityError
-from flask import current_app
-from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
-app = Flask(__name__)
-db = SQLAlchemy(app)
-from models import User
+from typing import Optional, List, Tuple, Iterable, Iterator
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import make_transient_to_detached
+from app.modules.web_application.models.models import (db, User, OAuth, PromptLog, ScrapeJob, ScrapeJobItem,
+                                                       ScrapedContent, ScrapedData, SimHashBand, UrlFetchCache,
+                                                       EXTRACTION_FIELDS)
+from app.modules.web_application.methods.pagination_methods import DEFAULT_LIMIT, paginate, paginate_ranked, project
+from app.modules.web_application.methods.search_methods import UserSearch
+from app.modules.web_application.methods.cache_methods import TTLCache, TieredCache, LocalSharedCache
+from app.modules.web_application.methods.import_methods import clean_user_record
+from app.modules.web_application.methods.media_methods import MediaStore
+from app.config.config import UserCacheConfig, BulkUserConfig
+
+USER_COLUMNS = ("id", "name", "email", "social_login_provider", "profile_picture", "created_at", "updated_at")
+SCRAPE_COPY_FIELDS = ("content", "content_id", "content_hash", "simhash")
+UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def build_user_cache(shared=None):
+    if shared is None and UserCacheConfig.shared == "local":
+        shared = LocalSharedCache()
+    return TieredCache(TTLCache(max_size=UserCacheConfig.size, ttl=UserCacheConfig.ttl), shared)
+
+
 class UserService:
+    cache = build_user_cache()
+    media = MediaStore()
+
+    @staticmethod
+    def configure_cache(shared=None):
+        UserService.cache = build_user_cache(shared)
+
+    @staticmethod
+    def cache_stats() -> dict:
+        return UserService.cache.stats()
+
+    @staticmethod
+    def cache_user(user: 'User') -> None:
+        UserService.cache.set(f"user:id:{user.id}", {column: getattr(user, column) for column in USER_COLUMNS})
+        UserService.cache.set(f"user:email:{user.email}", user.id)
+
+    @staticmethod
+    def invalidate_user(user_id: int, *emails: Optional[str]) -> None:
+        UserService.cache.delete(f"user:id:{user_id}", *[f"user:email:{email}" for email in emails if email])
+
     @staticmethod
     def create_user(name: str, email: str, social_login_provider: Optional[str] = None, 
                    profile_picture: Optional[str] = None) -> Optional['User']:
@@ -23,6 +59,7 @@ class UserService:
             )
             db.session.add(user)
             db.session.commit()
+            UserService.invalidate_user(user.id, email)
             return user
         except IntegrityError:
             db.session.rollback()
@@ -30,11 +67,27 @@ class UserService:
         
     @staticmethod
     def get_user_by_id(user_id: int) -> Optional['User']:
-        return User.query.get(user_id)
+        data = UserService.cache.get(f"user:id:{user_id}")
+        if data is not None:
+            user = User(**data)
+            make_transient_to_detached(user)
+            return db.session.merge(user, load=False)
+
+        user = User.query.get(user_id)
+        if user:
+            UserService.cache_user(user)
+        return user
     
     @staticmethod
     def get_user_by_email(email: str) -> Optional['User']:
-        return User.query.filter_by(email=email).first()
+        user_id = UserService.cache.get(f"user:email:{email}")
+        if user_id is not None:
+            return UserService.get_user_by_id(user_id)
+
+        user = User.query.filter_by(email=email).first()
+        if user:
+            UserService.cache_user(user)
+        return user
     
     @staticmethod
     def get_all_users() -> List['User']:
@@ -46,14 +99,18 @@ class UserService:
         if not user:
             return None
         
+        old_email = user.email
         try:
             for key, value in kwargs.items():
                 if hasattr(user, key):
                     setattr(user, key, value)
+            new_email = user.email
             db.session.commit()
+            UserService.invalidate_user(user_id, old_email, new_email)
             return user
         except IntegrityError:
             db.session.rollback()
+            UserService.invalidate_user(user_id, old_email)
             return None
     
     @staticmethod
@@ -62,44 +119,211 @@ class UserService:
         if not user:
             return False
         
+        email = user.email
         try:
-            db.session.delete(user)
+            UserService.delete_user_rows([user_id])
             db.session.commit()
+            UserService.invalidate_user(user_id, email)
             return True
         except:
             db.session.rollback()
             return False
     
     @staticmethod
-    def upload_profile_picture(user_id: int, file) -> Optional[str]:
+    def upload_profile_picture(user_id: int, stream) -> Optional[str]:
         user = UserService.get_user_by_id(user_id)
         if not user:
             return None
         
+        key = UserService.media.save(stream)
         try:
-            filename = secure_filename(file.filename)
-            unique_filename = f"{user_id}_{int(datetime.utcnow().timestamp())}_{filename}"
-            upload_folder = current_app.config.get('UPLOAD_FOLDER', 'uploads/profile_pictures')
-            os.makedirs(upload_folder, exist_ok=True)
-            file_path = os.path.join(upload_folder, unique_filename)
-            file.save(file_path)
-            user.profile_picture = file_path
+            email = user.email
+            user.profile_picture = key
             db.session.commit()
+            UserService.invalidate_user(user_id, email)
             
-            return file_path
+            return key
         except Exception as e:
             db.session.rollback()
             return None
 
     @staticmethod
-    def search_users(search_term: str) -> List['User']:
-        return User.query.filter(
-            db.or_(
-                User.name.ilike(f"%{search_term}%"),
-                User.email.ilike(f"%{search_term}%")
+    def bulk_upsert_users(records: Iterable, batch_size: Optional[int] = None,
+                          on_conflict: str = "update") -> Iterator[dict]:
+        batch_size = batch_size or BulkUserConfig.batch_size
+        batch = []
+        errors = []
+        for row, record in enumerate(records, 1):
+            try:
+                batch.append((row, clean_user_record(record)))
+            except ValueError as e:
+                errors.append({"row": row, "status": "error", "error": str(e)})
+                continue
+            if len(batch) >= batch_size:
+                yield from sorted(errors + UserService.upsert_batch(batch, on_conflict), key=lambda result: result["row"])
+                batch = []
+                errors = []
+        if batch or errors:
+            yield from sorted(errors + UserService.upsert_batch(batch, on_conflict), key=lambda result: result["row"])
+
+    @staticmethod
+    def upsert_batch(batch: List[Tuple[int, dict]], on_conflict: str = "update") -> List[dict]:
+        if not batch:
+            return []
+        results = {}
+        rows = {}
+        for row, values in batch:
+            email = values["email"]
+            if email in rows:
+                previous = rows[email][0]
+                results[previous] = {"row": previous, "status": "duplicate", "email": email, "superseded_by": row}
+            rows[email] = (row, values)
+        emails = list(rows)
+
+        try:
+            existing = dict(db.session.query(User.email, User.id).filter(User.email.in_(emails)))
+            now = datetime.utcnow()
+            values = [dict(data, created_at=now, updated_at=now) for _, data in rows.values()]
+            UserService.execute_upsert(values, existing, on_conflict)
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            error = str(getattr(e, "orig", None) or e)
+            for email, (row, _) in rows.items():
+                results[row] = {"row": row, "status": "error", "email": email, "error": error}
+            return [results[row] for row in sorted(results)]
+
+        ids = dict(db.session.query(User.email, User.id).filter(User.email.in_(emails)))
+        for email, (row, _) in rows.items():
+            if email not in existing:
+                status = "created"
+            elif on_conflict == "skip":
+                status = "skipped"
+            else:
+                status = "updated"
+                UserService.invalidate_user(existing[email], email)
+            results[row] = {"row": row, "status": status, "id": ids.get(email), "email": email}
+        return [results[row] for row in sorted(results)]
+
+    @staticmethod
+    def execute_upsert(values: List[dict], existing: dict, on_conflict: str = "update") -> None:
+        dialect_insert = UPSERT_DIALECTS.get(db.engine.dialect.name)
+        if dialect_insert is None:
+            new_rows = [row for row in values if row["email"] not in existing]
+            if new_rows:
+                db.session.execute(insert(User), new_rows)
+            if on_conflict == "update":
+                updates = []
+                for row in values:
+                    if row["email"] in existing:
+                        changes = {key: row[key] for key in ("social_login_provider", "profile_picture") if row[key] is not None}
+                        updates.append(dict(changes, id=existing[row["email"]], name=row["name"], updated_at=row["updated_at"]))
+                if updates:
+                    db.session.execute(update(User), updates)
+            return
+
+        statement = dialect_insert(User.__table__)
+        if on_conflict == "skip":
+            statement = statement.on_conflict_do_nothing(index_elements=["email"])
+        else:
+            excluded = statement.excluded
+            statement = statement.on_conflict_do_update(
+                index_elements=["email"],
+                set_={
+                    "name": excluded.name,
+                    "social_login_provider": func.coalesce(excluded.social_login_provider, User.__table__.c.social_login_provider),
+                    "profile_picture": func.coalesce(excluded.profile_picture, User.__table__.c.profile_picture),
+                    "updated_at": excluded.updated_at,
+                },
             )
-        ).all()
+        db.session.execute(statement, values)
+
+    @staticmethod
+    def bulk_delete_users(user_ids: List[int], batch_size: Optional[int] = None) -> dict:
+        batch_size = batch_size or BulkUserConfig.batch_size
+        ids = list(dict.fromkeys(user_ids))
+        deleted = []
+        failed = []
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start:start + batch_size]
+            try:
+                found = dict(db.session.query(User.id, User.email).filter(User.id.in_(chunk)))
+                if found:
+                    UserService.delete_user_rows(list(found))
+                    db.session.commit()
+            except SQLAlchemyError:
+                db.session.rollback()
+                failed.extend(chunk)
+                continue
+            for user_id, email in found.items():
+                UserService.invalidate_user(user_id, email)
+            deleted.extend(user_id for user_id in chunk if user_id in found)
+
+        done = set(deleted) | set(failed)
+        return {
+            "deleted": deleted,
+            "not_found": [user_id for user_id in ids if user_id not in done],
+            "failed": failed,
+        }
+
+    @staticmethod
+    def promote_references(user_ids: List[int]) -> None:
+        scrapes = select(ScrapedData.id).where(ScrapedData.created_by_user_id.in_(user_ids))
+        heirs = (db.session.query(ScrapedData.canonical_id, func.min(ScrapedData.id))
+                 .filter(ScrapedData.canonical_id.in_(scrapes), ScrapedData.created_by_user_id.not_in(user_ids))
+                 .group_by(ScrapedData.canonical_id).all())
+        for canonical_id, heir_id in heirs:
+            canonical = db.session.get(ScrapedData, canonical_id)
+            values = {field: getattr(canonical, field) for field in EXTRACTION_FIELDS + SCRAPE_COPY_FIELDS}
+            statements = (
+                update(ScrapedData).where(ScrapedData.id == heir_id).values(canonical_id=None, **values),
+                update(ScrapedData).where(ScrapedData.canonical_id == canonical_id).values(canonical_id=heir_id),
+                update(SimHashBand).where(SimHashBand.scraped_data_id == canonical_id).values(scraped_data_id=heir_id),
+                update(UrlFetchCache).where(UrlFetchCache.scraped_data_id == canonical_id).values(scraped_data_id=heir_id),
+                update(ScrapeJobItem).where(ScrapeJobItem.scraped_data_id == canonical_id).values(scraped_data_id=heir_id),
+            )
+            for statement in statements:
+                db.session.execute(statement, execution_options={"synchronize_session": False})
+
+    @staticmethod
+    def delete_user_rows(user_ids: List[int]) -> None:
+        UserService.promote_references(user_ids)
+        scrapes = select(ScrapedData.id).where(ScrapedData.created_by_user_id.in_(user_ids))
+        jobs = select(ScrapeJob.id).where(ScrapeJob.created_by_user_id.in_(user_ids))
+        content_ids = db.session.scalars(select(ScrapedData.content_id).distinct().where(
+            ScrapedData.created_by_user_id.in_(user_ids), ScrapedData.content_id.is_not(None))).all()
+        statements = (
+            delete(SimHashBand).where(SimHashBand.scraped_data_id.in_(scrapes)),
+            delete(UrlFetchCache).where(UrlFetchCache.scraped_data_id.in_(scrapes)),
+            delete(ScrapeJobItem).where(ScrapeJobItem.job_id.in_(jobs)),
+            update(ScrapeJobItem).where(ScrapeJobItem.scraped_data_id.in_(scrapes)).values(scraped_data_id=None),
+            delete(ScrapeJob).where(ScrapeJob.created_by_user_id.in_(user_ids)),
+            delete(ScrapedData).where(ScrapedData.created_by_user_id.in_(user_ids)),
+            delete(ScrapedContent).where(ScrapedContent.id.in_(content_ids),
+                                         ~exists().where(ScrapedData.content_id == ScrapedContent.id)),
+            delete(PromptLog).where(PromptLog.created_by_user_id.in_(user_ids)),
+            delete(OAuth).where(OAuth.user_id.in_(user_ids)),
+            delete(User).where(User.id.in_(user_ids)),
+        )
+        for statement in statements:
+            db.session.execute(statement, execution_options={"synchronize_session": False})
+
+    @staticmethod
+    def search_users(search_term: str, limit: int = DEFAULT_LIMIT) -> List['User']:
+        return UserSearch.search(search_term, limit=limit)
 
     @staticmethod
     def get_users_by_provider(provider: str) -> List['User']:
         return User.query.filter_by(social_login_provider=provider).all()
+
+    @staticmethod
+    def list_users(search_term: Optional[str] = None, provider: Optional[str] = None,
+                   limit: int = DEFAULT_LIMIT, cursor: Optional[str] = None,
+                   fields: Optional[List[str]] = None) -> Tuple[List['User'], Optional[str]]:
+        query = User.query
+        if provider:
+            query = query.filter_by(social_login_provider=provider)
+        if search_term:
+            query, ranks = UserSearch.ranked(query, search_term)
+            return paginate_ranked(project(query, User, fields), User, ranks, limit, cursor)
+        return paginate(project(query, User, fields), User, limit, cursor)
@@ -0,0 +1,101 @@
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.orm import load_only
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+KEY_FIELDS = ("id", "created_at")
+
+
+def encode_cursor(created_at, row_id):
+    payload = json.dumps([created_at.isoformat() if created_at else None, row_id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    try:
+        created_at, row_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def encode_rank_cursor(ranks, row_id):
+    payload = json.dumps(list(ranks) + [row_id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_rank_cursor(cursor, size):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(values, list) or len(values) != size + 1:
+            raise ValueError
+        return [float(value) for value in values[:-1]], int(values[-1])
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def parse_limit(value):
+    if value is None:
+        return DEFAULT_LIMIT
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    return min(limit, MAX_LIMIT)
+
+
+def parse_fields(value, allowed):
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(list(KEY_FIELDS) + fields))
+
+
+def project(query, model, fields):
+    if not fields:
+        return query
+    return query.options(load_only(*[getattr(model, field) for field in fields]))
+
+
+def paginate(query, model, limit=DEFAULT_LIMIT, cursor=None):
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                model.created_at < created_at,
+                and_(model.created_at == created_at, model.id < row_id),
+            )
+        )
+
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows, next_cursor
+
+
+def paginate_ranked(query, model, ranks, limit=DEFAULT_LIMIT, cursor=None):
+    query = query.add_columns(*ranks).order_by(*ranks, model.id)
+    if cursor:
+        values, row_id = decode_rank_cursor(cursor, len(ranks))
+        query = query.filter(tuple_(*ranks, model.id) > tuple_(*values, row_id))
+
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_rank_cursor(rows[-1][1:], rows[-1][0].id)
+    return [row[0] for row in rows], next_cursor
@@ -1,53 +1,292 @@
-import os
-from langchain.llms import OpenAI
+import hashlib
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from langchain.document_loaders import WebBaseLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.chains.summarize import load_summarize_chain
-from app.modules.web_application.models import PromptLog
-from flask_sqlalchemy import SQLAlchemy
-from flask import Flask
-from dotenv import load_dotenv
+from langchain.chains.summarize import map_reduce_prompt
+from app.config.config import PromptConfig, SimHashConfig
+from app.modules.web_application.models.models import db, PromptLog
+from app.modules.web_application.methods.cache_methods import TTLCache
+from app.modules.web_application.methods.llm_methods import create_llm
+from app.modules.web_application.methods.metrics_methods import record_stage, stage
+from app.modules.web_application.methods.retrieval_methods import select_chunks
+from app.modules.web_application.methods.simhash_methods import SimHashIndex, simhash
+from app.modules.web_application.methods.write_behind_methods import write_behind
 
-load_dotenv()
 
-app = Flask(__name__)
-db = SQLAlchemy(app)
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
 class PromptService:
-    def __init__(self):
-        self.llm = OpenAI(openai_api_key=os.getenv("OPENAI_API_KEY"), temperature=0.7)
+    def __init__(self, llm=None):
+        self.llm = llm or create_llm()
+        self.map_executor = ThreadPoolExecutor(max_workers=PromptConfig.map_concurrency)
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=PromptConfig.chunk_size, chunk_overlap=PromptConfig.chunk_overlap
+        )
+        self.summary_cache = TTLCache(
+            max_size=PromptConfig.summary_cache_size,
+            ttl=PromptConfig.summary_cache_ttl,
+        )
+        self.chunk_cache = TTLCache(
+            max_size=PromptConfig.chunk_cache_size,
+            ttl=PromptConfig.summary_cache_ttl,
+        )
+        self.summary_index = SimHashIndex(max_size=PromptConfig.summary_cache_size)
 
-    def process_prompt(self, url, user_prompt):
+    def process_prompt(self, user_id, url, user_prompt, mode="summarize"):
         try:
-            loader = WebBaseLoader(url)
-            documents = loader.load()
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=1000, chunk_overlap=200
-            )
-            split_docs = text_splitter.split_documents(documents)
-            summarize_chain = load_summarize_chain(self.llm, chain_type="map_reduce")
-            summary = summarize_chain.run(split_docs)
-            full_context = f"Website Summary: {summary}\n\nUser Prompt: {user_prompt}"
-            response = self.llm(full_context)
-            input_tokens = len(full_context.split())
-            output_tokens = len(response.split())
-            prompt_log = PromptLog(
-                prompt=user_prompt,
-                response=response,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-            )
-
-            db.session.add(prompt_log)
-            db.session.commit()
+            context = None
+            for event in self.context_events(url, user_prompt, mode):
+                if event["event"] == "context":
+                    context = event
+            full_context = context["full_context"]
+            with stage("llm_generate"):
+                response = self.call_llm(full_context)
+            input_tokens = self.count_tokens(full_context)
+            output_tokens = self.count_tokens(response)
+            self.log_prompt(user_id, user_prompt, response)
 
-            return {
+            result = {
                 "response": "Generating answer for your query as " + response,
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
             }
+            if context["chunks_used"] is not None:
+                result["chunks_used"] = context["chunks_used"]
+            return result
 
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Processing error: {str(e)}")
+
+    def stream_prompt(self, user_id, url, user_prompt, mode="summarize"):
+        try:
+            full_context = None
+            for event in self.context_events(url, user_prompt, mode):
+                if event["event"] == "context":
+                    full_context = event.pop("full_context")
+                    if event["chunks_used"] is None:
+                        continue
+                yield event
+
+            response_parts = []
+            for token in self.llm.stream(full_context):
+                response_parts.append(token)
+                yield {"event": "token", "text": token}
+
+            response = "".join(response_parts)
+            input_tokens = self.count_tokens(full_context)
+            output_tokens = self.count_tokens(response)
+            self.log_prompt(user_id, user_prompt, response)
+            yield {
+                "event": "done",
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+            }
+
+        except Exception as e:
+            db.session.rollback()
+            yield {"event": "error", "error": f"Processing error: {str(e)}"}
+
+    def context_events(self, url, user_prompt, mode="summarize"):
+        if mode == "retrieve":
+            yield from self.retrieval_events(url, user_prompt)
+            return
+
+        summary = None
+        for event in self.summary_events(url):
+            if event["event"] == "summary":
+                summary = event.pop("summary")
+            yield event
+        yield {
+            "event": "context",
+            "full_context": f"Website Summary: {summary}\n\nUser Prompt: {user_prompt}",
+            "chunks_used": None,
+        }
+
+    def retrieval_events(self, url, user_prompt):
+        documents = self.load_documents(url)
+        yield {"event": "fetched", "documents": len(documents)}
+
+        with stage("split"):
+            chunks = [
+                doc.page_content
+                for doc in self.text_splitter.split_documents(documents)
+            ]
+        yield {"event": "split", "chunks": len(chunks)}
+
+        with stage("retrieve"):
+            chunks_used = select_chunks(
+                chunks,
+                user_prompt,
+                top_k=PromptConfig.retrieval_top_k,
+                token_budget=PromptConfig.retrieval_token_budget,
+                count_tokens=self.count_tokens,
+            )
+        context = "\n\n".join(chunks[chunk["index"]] for chunk in chunks_used)
+        yield {
+            "event": "context",
+            "full_context": f"Website Context:\n{context}\n\nUser Prompt: {user_prompt}",
+            "chunks_used": chunks_used,
+        }
+
+    def count_tokens(self, text):
+        try:
+            return self.llm.get_num_tokens(text)
+        except Exception:
+            return len(text.split())
+
+    def log_prompt(self, user_id, user_prompt, response):
+        row = {
+            "prompt_text": user_prompt,
+            "generated_output": response,
+            "created_by_user_id": user_id,
+            "created_at": datetime.utcnow(),
+        }
+        if write_behind.submit(PromptLog, row):
+            return
+
+        try:
+            db.session.add(PromptLog(**row))
+            with stage("db_commit"):
+                db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+    def summarize_url(self, url):
+        for event in self.summary_events(url):
+            if event["event"] == "summary":
+                return event["summary"]
+
+    def summary_events(self, url):
+        documents = self.load_documents(url)
+        yield {"event": "fetched", "documents": len(documents)}
+        yield from self.document_summary_events(url, documents)
+
+    def load_documents(self, url):
+        with stage("load"):
+            return WebBaseLoader(url).load()
+
+    def document_summary_events(self, url, documents):
+        text = "".join(doc.page_content for doc in documents)
+        key = (url, content_hash(text))
+        summary = self.summary_cache.get(key)
+        if summary is not None:
+            yield {"event": "summary", "summary": summary, "cached": True}
+            return
+
+        fingerprint = None
+        if SimHashConfig.reuse_summaries:
+            with stage("simhash"):
+                fingerprint = simhash(text)
+        if fingerprint is not None:
+            for _, near_key in self.summary_index.query(fingerprint):
+                summary = self.summary_cache.get(near_key)
+                if summary is not None:
+                    self.summary_cache.set(key, summary)
+                    yield {
+                        "event": "summary",
+                        "summary": summary,
+                        "cached": True,
+                        "near_duplicate_of": near_key[0],
+                    }
+                    return
+
+        with stage("split"):
+            split_docs = self.text_splitter.split_documents(documents)
+        total = len(split_docs)
+        yield {"event": "split", "chunks": total}
+
+        started = time.perf_counter()
+        futures = {
+            self.map_executor.submit(self.summarize_chunk, doc.page_content): index
+            for index, doc in enumerate(split_docs)
+        }
+        chunk_summaries = [None] * total
+        for done, future in enumerate(as_completed(futures), 1):
+            chunk_summaries[futures[future]] = future.result()
+            yield {"event": "map", "done": done, "total": total}
+        record_stage("llm_map", time.perf_counter() - started)
+
+        started = time.perf_counter()
+        level = 0
+        while True:
+            groups = self.group_summaries(chunk_summaries)
+            if 1 < len(groups) == len(chunk_summaries):
+                chunk_summaries = list(
+                    self.map_executor.map(self.shrink_summary, chunk_summaries)
+                )
+                groups = self.group_summaries(chunk_summaries)
+            if len(groups) <= 1:
+                break
+            level += 1
+            yield {"event": "reduce", "level": level, "groups": len(groups)}
+            chunk_summaries = list(self.map_executor.map(self.combine, groups))
+
+        summary = self.combine(chunk_summaries)
+        record_stage("llm_reduce", time.perf_counter() - started)
+        self.summary_cache.set(key, summary)
+        if fingerprint is not None:
+            self.summary_index.add(key, fingerprint)
+        yield {"event": "summary", "summary": summary, "cached": False}
+
+    def group_summaries(self, summaries):
+        groups = []
+        current = []
+        current_length = 0
+        for summary in summaries:
+            if (
+                current
+                and current_length + len(summary) > PromptConfig.reduce_max_chars
+            ):
+                groups.append(current)
+                current = []
+                current_length = 0
+            current.append(summary)
+            current_length += len(summary) + 2
+        if current:
+            groups.append(current)
+        return groups
+
+    def shrink_summary(self, summary):
+        limit = (PromptConfig.reduce_max_chars - 2) // 2
+        if len(summary) <= limit:
+            return summary
+        return self.summarize_chunk(summary)[:limit]
+
+    def combine(self, summaries):
+        return self.call_llm(
+            map_reduce_prompt.PROMPT.format(text="\n\n".join(summaries))
+        )
+
+    def summarize_chunk(self, text):
+        key = content_hash(text)
+        summary = self.chunk_cache.get(key)
+        if summary is None:
+            summary = self.call_llm(map_reduce_prompt.PROMPT.format(text=text))
+            self.chunk_cache.set(key, summary)
+        return summary
+
+    def call_llm(self, prompt):
+        attempt = 0
+        while True:
+            try:
+                with stage("llm_call"):
+                    return self.llm(prompt)
+            except Exception:
+                attempt += 1
+                if attempt > PromptConfig.llm_max_retries:
+                    raise
+                delay = PromptConfig.llm_retry_backoff * 2 ** (attempt - 1)
+                time.sleep(delay + random.uniform(0, delay))
+
+    def cache_stats(self):
+        return {
+            "summaries": self.summary_cache.stats(),
+            "chunks": self.chunk_cache.stats(),
+        }
@@ -0,0 +1,68 @@
+import math
+import re
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how i in is it of on or that the "
+    "this to was what when where which who why will with you your".split()
+)
+
+
+def tokenize(text):
+    return [
+        token
+        for token in (match.lower() for match in TOKEN_PATTERN.findall(text))
+        if token not in STOPWORDS
+    ]
+
+
+class BM25Index:
+    def __init__(self, texts, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(tokenize(text)) for text in texts]
+        self.lengths = [sum(freqs.values()) for freqs in self.term_freqs]
+        self.average_length = (
+            sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+        )
+        document_freqs = Counter()
+        for freqs in self.term_freqs:
+            document_freqs.update(freqs.keys())
+        total = len(self.term_freqs)
+        self.idf = {
+            term: math.log(1 + (total - freq + 0.5) / (freq + 0.5))
+            for term, freq in document_freqs.items()
+        }
+
+    def scores(self, query):
+        terms = [term for term in set(tokenize(query)) if term in self.idf]
+        scores = []
+        for freqs, length in zip(self.term_freqs, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.average_length or 1))
+            score = 0.0
+            for term in terms:
+                freq = freqs.get(term)
+                if freq:
+                    score += self.idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            scores.append(score)
+        return scores
+
+
+def select_chunks(chunks, query, top_k, token_budget, count_tokens):
+    scores = BM25Index(chunks).scores(query)
+    ranked = sorted(range(len(chunks)), key=lambda index: (-scores[index], index))
+
+    selected = []
+    used_tokens = 0
+    for index in ranked:
+        if len(selected) >= top_k:
+            break
+        tokens = count_tokens(chunks[index])
+        if selected and used_tokens + tokens > token_budget:
+            continue
+        selected.append(
+            {"index": index, "score": round(scores[index], 4), "tokens": tokens}
+        )
+        used_tokens += tokens
+    return sorted(selected, key=lambda chunk: chunk["index"])
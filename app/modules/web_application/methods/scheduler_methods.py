@@ -0,0 +1,275 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib import robotparser
+from urllib.parse import urlparse
+
+import requests
+
+from app.config.config import SchedulerConfig
+from app.modules.web_application.methods.cache_methods import TTLCache
+from app.modules.web_application.methods.fetch_methods import RateLimited
+
+
+class RobotsDisallowed(Exception):
+    pass
+
+
+def host_key(url):
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{(parsed.netloc or '').lower()}"
+
+
+class RobotsCache:
+    def __init__(self, user_agent=None, ttl=None, timeout=None, max_size=4096):
+        self.user_agent = user_agent or SchedulerConfig.user_agent
+        self.timeout = timeout or SchedulerConfig.robots_timeout
+        self.cache = TTLCache(max_size=max_size, ttl=ttl or SchedulerConfig.robots_ttl)
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = (
+            f"Mozilla/5.0 (compatible; {self.user_agent}/1.0)"
+        )
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def parser(self, url):
+        host = host_key(url)
+        parser = self.cache.get(host)
+        if parser is not None:
+            return parser
+
+        with self._lock:
+            host_lock = self._locks.setdefault(host, threading.Lock())
+        with host_lock:
+            parser = self.cache.get(host)
+            if parser is None:
+                parser = self.fetch(host)
+                self.cache.set(host, parser)
+        with self._lock:
+            self._locks.pop(host, None)
+        return parser
+
+    def fetch(self, host):
+        parser = robotparser.RobotFileParser(f"{host}/robots.txt")
+        try:
+            response = self.session.get(f"{host}/robots.txt", timeout=self.timeout)
+        except requests.RequestException:
+            parser.parse([])
+            return parser
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code == 200:
+            parser.parse(response.text.splitlines())
+        else:
+            parser.parse([])
+        return parser
+
+    def allowed(self, url):
+        return self.parser(url).can_fetch(self.user_agent, url)
+
+    def crawl_delay(self, url):
+        parser = self.parser(url)
+        delay = parser.crawl_delay(self.user_agent)
+        if delay is None:
+            rate = parser.request_rate(self.user_agent)
+            if rate is not None and rate.requests:
+                delay = rate.seconds / rate.requests
+        return float(delay) if delay else 0.0
+
+
+class HostState:
+    def __init__(self, host):
+        self.host = host
+        self.queue = deque()
+        self.active = 0
+        self.next_at = 0.0
+        self.crawl_delay = 0.0
+        self.backoff = 0.0
+        self.completed = 0
+        self.rate_limited = 0
+
+
+class Task:
+    def __init__(self, url, fn, args, kwargs):
+        self.url = url
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        self.attempts = 0
+
+
+class HostScheduler:
+    def __init__(
+        self,
+        concurrency=None,
+        per_host_concurrency=None,
+        per_host_rate=None,
+        robots=None,
+        max_retries=None,
+    ):
+        self.concurrency = concurrency or SchedulerConfig.concurrency
+        self.per_host_concurrency = (
+            per_host_concurrency or SchedulerConfig.per_host_concurrency
+        )
+        rate = SchedulerConfig.per_host_rate if per_host_rate is None else per_host_rate
+        self.min_interval = 1.0 / rate if rate else 0.0
+        if robots is None and SchedulerConfig.respect_robots:
+            robots = RobotsCache()
+        self.robots = robots
+        self.max_retries = (
+            SchedulerConfig.max_retries if max_retries is None else max_retries
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="host-scheduler"
+        )
+        self.hosts = {}
+        self.rotation = deque()
+        self.active = 0
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread = None
+
+    def submit(self, url, fn, *args, **kwargs) -> Future:
+        task = Task(url, fn, args, kwargs)
+        host = host_key(url)
+        with self._cond:
+            if self._stop:
+                raise RuntimeError("Scheduler is closed")
+            state = self.hosts.get(host)
+            if state is None:
+                state = self.hosts[host] = HostState(host)
+            self._enqueue(state, task)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._dispatch, name="host-dispatcher", daemon=True
+                )
+                self._thread.start()
+        return task.future
+
+    def _enqueue(self, state, task, front=False):
+        if front:
+            state.queue.appendleft(task)
+        else:
+            state.queue.append(task)
+        if state.host not in self.rotation:
+            self.rotation.append(state.host)
+        self._cond.notify_all()
+
+    def interval(self, state):
+        return max(self.min_interval, state.crawl_delay, state.backoff)
+
+    def pending(self, url):
+        with self._cond:
+            state = self.hosts.get(host_key(url))
+            return len(state.queue) + state.active if state else 0
+
+    def saturated(self, url):
+        return self.pending(url) >= self.per_host_concurrency * 2
+
+    def _dispatch(self):
+        with self._cond:
+            while not self._stop:
+                wait = None
+                dispatched = False
+                for _ in range(len(self.rotation)):
+                    if self.active >= self.concurrency:
+                        break
+                    host = self.rotation[0]
+                    self.rotation.rotate(-1)
+                    state = self.hosts[host]
+                    now = time.monotonic()
+                    if not state.queue:
+                        self.rotation.remove(host)
+                        if (
+                            not state.active
+                            and not state.backoff
+                            and now >= state.next_at
+                        ):
+                            del self.hosts[host]
+                        continue
+                    if state.active >= self.per_host_concurrency:
+                        continue
+                    if now < state.next_at:
+                        delay = state.next_at - now
+                        wait = delay if wait is None else min(wait, delay)
+                        continue
+                    task = state.queue.popleft()
+                    state.active += 1
+                    state.next_at = now + self.interval(state)
+                    self.active += 1
+                    dispatched = True
+                    self.executor.submit(self._run, state, task)
+                if not dispatched:
+                    self._cond.wait(wait)
+
+    def _run(self, state, task):
+        retry = False
+        try:
+            if self.robots is not None:
+                if not self.robots.allowed(task.url):
+                    raise RobotsDisallowed(f"{task.url} is disallowed by robots.txt")
+                crawl_delay = self.robots.crawl_delay(task.url)
+                with self._cond:
+                    if crawl_delay > state.crawl_delay:
+                        state.next_at += crawl_delay - state.crawl_delay
+                    state.crawl_delay = crawl_delay
+            result = task.fn(*task.args, **task.kwargs)
+        except RateLimited as e:
+            with self._cond:
+                self._back_off(state, e.retry_after)
+                retry = task.attempts < self.max_retries
+                if retry:
+                    task.attempts += 1
+                    self._enqueue(state, task, front=True)
+            if not retry:
+                task.future.set_exception(e)
+        except BaseException as e:
+            task.future.set_exception(e)
+        else:
+            with self._cond:
+                state.completed += 1
+                state.backoff = state.backoff / 2 if state.backoff >= 0.5 else 0.0
+            task.future.set_result(result)
+        finally:
+            with self._cond:
+                state.active -= 1
+                self.active -= 1
+                self._cond.notify_all()
+
+    def _back_off(self, state, retry_after=None):
+        state.rate_limited += 1
+        state.backoff = min(
+            SchedulerConfig.max_backoff,
+            max(SchedulerConfig.initial_backoff, state.backoff * 2),
+        )
+        wait = max(state.backoff, retry_after or 0.0)
+        state.next_at = max(state.next_at, time.monotonic() + wait)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "active": self.active,
+                "hosts": {
+                    host: {
+                        "queued": len(state.queue),
+                        "active": state.active,
+                        "completed": state.completed,
+                        "rate_limited": state.rate_limited,
+                        "interval": self.interval(state),
+                    }
+                    for host, state in self.hosts.items()
+                },
+            }
+
+    def close(self, wait=True):
+        with self._cond:
+            self._stop = True
+            for state in self.hosts.values():
+                while state.queue:
+                    state.queue.popleft().future.cancel()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,152 @@
+from datetime import datetime
+from typing import Optional
+
+from app.config.config import SimHashConfig
+from app.modules.web_application.models.models import db, ScrapedData
+from app.modules.web_application.methods.content_methods import ContentStore
+from app.modules.web_application.methods.fetch_cache_methods import FetchCacheService
+from app.modules.web_application.methods.metrics_methods import stage
+from app.modules.web_application.methods.simhash_methods import NearDuplicateService
+from app.modules.web_application.methods.write_behind_methods import write_behind
+
+
+class ScrapeStoreService:
+    @staticmethod
+    def save(user_id: int, scraped_data: dict) -> ScrapedData:
+        scraped_data = dict(scraped_data)
+        scraped_data.pop("validators", None)
+        scraped_data.pop("links", None)
+        raw_content = scraped_data.pop("raw_content", None)
+        scrape = ScrapedData(user_id=user_id, **scraped_data)
+        try:
+            if raw_content is not None:
+                scrape.content_blob = ContentStore.put(
+                    raw_content, scraped_data["content_hash"]
+                )
+            db.session.add(scrape)
+            if scrape.simhash is not None:
+                db.session.add_all(
+                    NearDuplicateService.band_rows(scrape, scrape.simhash)
+                )
+            with stage("db_commit"):
+                db.session.commit()
+            return scrape
+        except Exception:
+            db.session.rollback()
+            raise
+
+    @staticmethod
+    def reference_row(
+        user_id: int, url: str, canonical: ScrapedData, fetch_tier: str
+    ) -> dict:
+        return {
+            "created_by_user_id": user_id,
+            "url": url,
+            "canonical_id": canonical.id,
+            "content_hash": canonical.content_hash,
+            "fetch_tier": fetch_tier,
+            "created_at": datetime.utcnow(),
+        }
+
+    @staticmethod
+    def save_reference(
+        user_id: int,
+        url: str,
+        canonical: ScrapedData,
+        fetch_tier: str,
+        defer: bool = False,
+    ) -> ScrapedData:
+        row = ScrapeStoreService.reference_row(user_id, url, canonical, fetch_tier)
+        scrape = ScrapedData(**row)
+        if defer and write_behind.submit(ScrapedData, row):
+            scrape.canonical = canonical
+            return scrape
+
+        try:
+            db.session.add(scrape)
+            with stage("db_commit"):
+                db.session.commit()
+            return scrape
+        except Exception:
+            db.session.rollback()
+            raise
+
+    @staticmethod
+    def scrape(
+        scraper,
+        user_id: int,
+        url: str,
+        max_age: Optional[int] = None,
+        defer: bool = False,
+    ) -> ScrapedData:
+        entry = FetchCacheService.get(url)
+        canonical = entry.scraped_data if entry else None
+        if canonical is not None and FetchCacheService.is_fresh(entry, max_age):
+            return ScrapeStoreService.save_reference(
+                user_id, url, canonical, "cache", defer=defer
+            )
+
+        scraped_data = scraper.scrape_url(
+            url, validators=FetchCacheService.validators(entry)
+        )
+        validators = scraped_data.get("validators") or {}
+
+        if scraped_data.get("not_modified"):
+            if canonical is None:
+                scraped_data = scraper.scrape_url(url)
+            else:
+                scrape = ScrapeStoreService.save_reference(
+                    user_id, url, canonical, scraped_data["fetch_tier"], defer=defer
+                )
+                FetchCacheService.record(
+                    url, validators, canonical.content_hash, canonical.id
+                )
+                return scrape
+
+        return ScrapeStoreService.store(
+            user_id, url, scraped_data, canonical, defer=defer
+        )
+
+    @staticmethod
+    def store(
+        user_id: int,
+        url: str,
+        scraped_data: dict,
+        canonical: Optional[ScrapedData] = None,
+        defer: bool = False,
+    ) -> ScrapedData:
+        if (
+            canonical is not None
+            and canonical.content_hash == scraped_data["content_hash"]
+        ):
+            scrape = ScrapeStoreService.save_reference(
+                user_id, url, canonical, scraped_data["fetch_tier"], defer=defer
+            )
+        else:
+            near = None
+            if SimHashConfig.policy in ("skip", "link"):
+                near = NearDuplicateService.find(scraped_data.get("simhash"))
+            if near is None:
+                scrape = ScrapeStoreService.save(user_id, scraped_data)
+                canonical = scrape
+            elif SimHashConfig.policy == "skip":
+                scrape = ScrapedData(
+                    **ScrapeStoreService.reference_row(
+                        user_id, url, near, scraped_data["fetch_tier"]
+                    )
+                )
+                scrape.canonical = near
+                canonical = near
+            else:
+                scrape = ScrapeStoreService.save_reference(
+                    user_id, url, near, scraped_data["fetch_tier"], defer=defer
+                )
+                canonical = near
+
+        FetchCacheService.record(
+            url,
+            scraped_data.get("validators") or {},
+            canonical.content_hash,
+            canonical.id,
+        )
+        return scrape
@@ -1,5 +1,4 @@
 import requests
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
@@ -7,21 +6,73 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from urllib.parse import urljoin
+import hashlib
+import threading
 import re
 import validators
-import whois
+from app.config.config import ScraperConfig, SimHashConfig
+from app.modules.web_application.methods.driver_pool import WebDriverPool
+from app.modules.web_application.methods.fetch_methods import (
+    RATE_LIMIT_STATUSES,
+    HttpFetcher,
+    RateLimited,
+    needs_browser,
+)
+from app.modules.web_application.methods.extraction_methods import ExtractionEngine
+from app.modules.web_application.methods.classifier_methods import IndustryClassifier
+from app.modules.web_application.methods.metrics_methods import stage
+from app.modules.web_application.methods.simhash_methods import simhash
+from app.modules.web_application.methods.whois_methods import (
+    WhoisService,
+    registrable_domain,
+)
 
 
 class WebScraperMethods:
-    def __init__(self):
+    def __init__(self, pool_size=None):
+        self._driver_path = ScraperConfig.chromedriver_path
+        self._driver_path_lock = threading.Lock()
+        self.pool = WebDriverPool(
+            self.create_driver,
+            size=pool_size or ScraperConfig.driver_pool_size,
+            warm_size=ScraperConfig.driver_warm_size,
+            max_pages=ScraperConfig.driver_max_pages,
+            checkout_timeout=ScraperConfig.driver_checkout_timeout,
+        )
+        if ScraperConfig.fetch_strategy != "http":
+            self.pool.warm_up()
+        self.http = HttpFetcher(
+            pool_size=ScraperConfig.http_pool_size, timeout=ScraperConfig.http_timeout
+        )
+        self.whois = WhoisService()
+        self.extractor = ExtractionEngine()
+        self.classifier = IndustryClassifier.from_path(
+            ScraperConfig.industry_taxonomy_path
+        )
+        self.tier_counts = Counter()
+        self._tier_lock = threading.Lock()
+
+    @property
+    def driver_path(self):
+        with self._driver_path_lock:
+            if self._driver_path is None:
+                self._driver_path = ChromeDriverManager().install()
+            return self._driver_path
+
+    def create_driver(self):
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
 
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()), options=chrome_options
+        driver = webdriver.Chrome(
+            service=Service(self.driver_path), options=chrome_options
         )
+        driver.set_page_load_timeout(ScraperConfig.page_load_timeout)
+        return driver
 
     def validate_url(self, url):
         return validators.url(url)
@@ -30,42 +81,117 @@ class WebScraperMethods:
         email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
         return re.findall(email_pattern, text)
 
-    def scrape_url(self, url):
+    def scrape_url(self, url, validators=None):
         try:
             if not self.validate_url(url):
                 raise ValueError("Invalid URL")
-            domain_info = whois.whois(url)
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, "html.parser")
-            title = soup.title.string if soup.title else ""
-            description_tag = soup.find("meta", attrs={"name": "description"})
-            description = description_tag["content"] if description_tag else ""
-            text_content = soup.get_text()
+            domain_info = self.whois.lookup_async(url)
+            page, fetch_tier, validators = self.fetch_page(url, validators)
+            if page is None:
+                return {
+                    "url": url,
+                    "not_modified": True,
+                    "fetch_tier": fetch_tier,
+                    "validators": validators,
+                }
+
+            text_content = page["text"]
             emails = self.extract_email(text_content)
             source_type = self.determine_source_type(url)
+            with stage("classify"):
+                industries = self.classifier.classify(text_content)
+            with stage("simhash"):
+                fingerprint = simhash(text_content) if SimHashConfig.enabled else None
+            with stage("whois"):
+                domain_info = domain_info.result()
             scraped_data = {
                 "url": url,
-                "name": self.extract_name(soup),
-                "about": self.extract_about(soup),
+                "name": page["name"],
+                "about": page["about"],
                 "source_type": source_type,
-                "industry": self.extract_industry(text_content),
-                "page_content_type": self.determine_page_type(soup),
-                "contact": self.extract_contact(soup),
+                "industry": industries[0]["industry"] if industries else "Unknown",
+                "industry_scores": industries,
+                "page_content_type": page["page_content_type"],
+                "contact": page["contact"],
                 "email": emails[0] if emails else None,
-                "title": title,
-                "description": description,
+                "title": page["title"],
+                "description": page["description"],
                 "raw_content": text_content,
+                "content_hash": hashlib.sha256(
+                    text_content.encode("utf-8")
+                ).hexdigest(),
+                "simhash": fingerprint,
+                "links": [
+                    urljoin(urljoin(url, page["base_href"] or ""), href)
+                    for href in page["links"]
+                ],
+                "validators": validators,
+                "fetch_tier": fetch_tier,
+                "domain": registrable_domain(url),
+                "domain_info": domain_info,
             }
 
             return scraped_data
 
+        except RateLimited:
+            raise
         except Exception as e:
             raise Exception(f"Scraping error: {str(e)}")
 
+    def fetch_page(self, url, validators=None):
+        strategy = ScraperConfig.fetch_strategy
+        if strategy != "browser":
+            try:
+                with stage("http_fetch"):
+                    response = self.http.fetch(url, validators)
+            except requests.RequestException:
+                response = None
+            if response is not None and response["status"] in RATE_LIMIT_STATUSES:
+                self.record_tier("rate_limited")
+                raise RateLimited(url, response["status"], response.get("retry_after"))
+            if response is not None and response["status"] == 304:
+                self.record_tier("not_modified")
+                return None, "not_modified", response["validators"]
+            if response is not None and response["html"] is not None:
+                with stage("parse"):
+                    page = self.extractor.extract(response["html"])
+                if strategy == "http" or not needs_browser(
+                    page, ScraperConfig.js_min_text_length
+                ):
+                    self.record_tier("http")
+                    return page, "http", response["validators"]
+
+        with self.pool.driver() as driver:
+            with stage("driver_get"):
+                driver.get(url)
+            with stage("driver_wait"):
+                WebDriverWait(driver, ScraperConfig.page_load_timeout).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+            page_source = driver.page_source
+        self.record_tier("browser")
+        with stage("parse"):
+            page = self.extractor.extract(page_source)
+        return page, "browser", {}
+
+    def record_tier(self, tier):
+        with self._tier_lock:
+            self.tier_counts[tier] += 1
+
+    def tier_stats(self):
+        with self._tier_lock:
+            return dict(self.tier_counts)
+
+    def scrape_urls(self, urls):
+        def scrape_one(url):
+            try:
+                return {"url": url, "data": self.scrape_url(url)}
+            except Exception as e:
+                return {"url": url, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+            return list(executor.map(scrape_one, urls))
+
     def determine_source_type(self, url):
         domain_mapping = {
             "linkedin.com": "Social Media - Professional",
@@ -80,47 +206,10 @@ class WebScraperMethods:
                 return type_name
         return "Website"
 
-    def extract_name(self, soup):
-        name_candidates = soup.find_all(["h1", "title", "meta"])
-        for candidate in name_candidates:
-            if candidate.get("property") == "og:title":
-                return candidate.get("content")
-        return ""
-
-    def extract_about(self, soup):
-        about_sections = soup.find_all(
-            ["div", "p"], class_=re.compile(r"about|description|bio", re.IGNORECASE)
-        )
-        return " ".join([section.get_text() for section in about_sections])[:500]
-
     def extract_industry(self, text):
-        industries = [
-            "Technology",
-            "Finance",
-            "Healthcare",
-            "Education",
-            "Marketing",
-            "Engineering",
-        ]
-        for industry in industries:
-            if industry.lower() in text.lower():
-                return industry
-        return "Unknown"
-
-    def extract_contact(self, soup):
-        contact_tags = soup.find_all(
-            ["a"], href=re.compile(r"tel:|contact", re.IGNORECASE)
-        )
-        return contact_tags[0].get("href") if contact_tags else ""
-
-    def determine_page_type(self, soup):
-        if soup.find("article"):
-            return "Blog/Article"
-        elif soup.find("profile"):
-            return "Profile Page"
-        elif soup.find("form"):
-            return "Contact/Landing Page"
-        return "General Website"
+        industries = self.classifier.classify(text, top_n=1)
+        return industries[0]["industry"] if industries else "Unknown"
 
     def close(self):
-        self.driver.quit()
+        self.pool.close()
+        self.whois.close()
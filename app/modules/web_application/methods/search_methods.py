@@ -0,0 +1,139 @@
+import re
+import threading
+
+from sqlalchemy import Float, Integer, case, false, func, literal, or_, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.modules.web_application.models.models import db, User
+
+TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+SQLITE_TRIGGERS = ("users_fts_ai", "users_fts_ad", "users_fts_au")
+SQLITE_SETUP = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+    "name, email, content='users', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN "
+    "INSERT INTO users_fts(rowid, name, email) VALUES (new.id, new.name, new.email); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, name, email) "
+    "VALUES ('delete', old.id, old.name, old.email); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, name, email) "
+    "VALUES ('delete', old.id, old.name, old.email); "
+    "INSERT INTO users_fts(rowid, name, email) VALUES (new.id, new.name, new.email); "
+    "END",
+)
+MIN_TRIGRAM_LENGTH = 3
+
+POSTGRES_SETUP = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_users_name_trgm ON users "
+    "USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users "
+    "USING gin (email gin_trgm_ops)",
+)
+
+
+class UserSearch:
+    _fts_ready = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def setup(cls):
+        engine = db.engine
+        dialect = engine.dialect.name
+        with engine.begin() as connection:
+            if dialect == "sqlite":
+                cls._setup_sqlite(connection)
+            elif dialect == "postgresql":
+                for statement in POSTGRES_SETUP:
+                    connection.execute(text(statement))
+        with cls._lock:
+            cls._fts_ready.pop(str(engine.url), None)
+        return dialect
+
+    @staticmethod
+    def _setup_sqlite(connection):
+        existing = connection.execute(
+            text("SELECT sql FROM sqlite_master WHERE name = 'users_fts'")
+        ).scalar()
+        if existing is not None and "trigram" not in existing:
+            for trigger in SQLITE_TRIGGERS:
+                connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+            connection.execute(text("DROP TABLE users_fts"))
+            existing = None
+        for statement in SQLITE_SETUP:
+            connection.execute(text(statement))
+        if existing is None:
+            connection.execute(
+                text("INSERT INTO users_fts(users_fts) VALUES ('rebuild')")
+            )
+
+    @classmethod
+    def fts_ready(cls):
+        key = str(db.engine.url)
+        if cls._fts_ready.get(key):
+            return True
+        try:
+            existing = db.session.execute(
+                text("SELECT sql FROM sqlite_master WHERE name = 'users_fts'")
+            ).scalar()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return False
+        ready = existing is not None and "trigram" in existing
+        if ready:
+            with cls._lock:
+                cls._fts_ready[key] = True
+        return ready
+
+    @staticmethod
+    def match_tier(term):
+        lowered = term.lower()
+        return case(
+            (
+                or_(
+                    func.lower(User.name) == lowered,
+                    func.lower(User.email) == lowered,
+                ),
+                0,
+            ),
+            (or_(User.name.ilike(f"{term}%"), User.email.ilike(f"{term}%")), 1),
+            else_=2,
+        )
+
+    @classmethod
+    def ranked(cls, query, term):
+        term = term.strip()
+        if not TERM_PATTERN.search(term):
+            return query.filter(false()), (literal(0),)
+        dialect = db.engine.dialect.name
+        if dialect == "sqlite" and len(term) >= MIN_TRIGRAM_LENGTH and cls.fts_ready():
+            match = '"' + term.replace('"', '""') + '"'
+            fts = (
+                text(
+                    "SELECT rowid AS id, bm25(users_fts) AS score "
+                    "FROM users_fts WHERE users_fts MATCH :match"
+                )
+                .bindparams(match=match)
+                .columns(id=Integer, score=Float)
+                .subquery("fts")
+            )
+            query = query.join(fts, fts.c.id == User.id)
+            return query, (cls.match_tier(term), fts.c.score)
+
+        pattern = f"%{term}%"
+        query = query.filter(or_(User.name.ilike(pattern), User.email.ilike(pattern)))
+        if dialect == "postgresql":
+            similarity = func.greatest(
+                func.similarity(User.name, term), func.similarity(User.email, term)
+            )
+            return query, (cls.match_tier(term), -similarity)
+        return query, (cls.match_tier(term),)
+
+    @classmethod
+    def search(cls, term, limit=20):
+        query, ranks = cls.ranked(User.query, term)
+        return query.order_by(*ranks, User.id).limit(limit).all()
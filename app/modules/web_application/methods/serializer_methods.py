@@ -0,0 +1,67 @@
+import hashlib
+from datetime import datetime
+
+import orjson
+from flask import Response, request, stream_with_context
+
+USER_FIELDS = (
+    "id",
+    "name",
+    "email",
+    "social_login_provider",
+    "profile_picture",
+    "created_at",
+    "updated_at",
+)
+
+
+def dumps(payload):
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS, default=str)
+
+
+def serialize_user(user, fields=None):
+    data = {}
+    for field in fields or USER_FIELDS:
+        value = getattr(user, field)
+        data[field] = value.isoformat() if isinstance(value, datetime) else value
+    return data
+
+
+def serialize_scrape(scrape, fields=None):
+    return scrape.to_dict(fields)
+
+
+def json_response(payload, status=200, headers=None):
+    return Response(
+        dumps(payload), status=status, headers=headers, mimetype="application/json"
+    )
+
+
+def stream_list_response(key, items, serializer, extra=None, status=200):
+    def generate():
+        yield b'{"' + key.encode("utf-8") + b'":['
+        for index, item in enumerate(items):
+            yield (b"," if index else b"") + dumps(serializer(item))
+        yield b"]"
+        for name, value in (extra() if callable(extra) else extra or {}).items():
+            yield b"," + dumps(name) + b":" + dumps(value)
+        yield b"}"
+
+    return Response(
+        stream_with_context(generate()), status=status, mimetype="application/json"
+    )
+
+
+def user_etag(user):
+    version = user.updated_at or user.created_at
+    token = f"{user.id}:{version.isoformat() if version else ''}"
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+
+def conditional_json_response(payload, etag):
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = json_response(payload)
+    response.set_etag(etag)
+    return response
@@ -0,0 +1,195 @@
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+
+from sqlalchemy import and_, or_
+
+from app.config.config import SimHashConfig
+from app.modules.web_application.models.models import db, ScrapedData, SimHashBand
+from app.modules.web_application.methods.content_methods import ContentStore
+from app.modules.web_application.methods.retrieval_methods import tokenize
+
+BITS = 64
+MASK = (1 << BITS) - 1
+BANDS = 4
+BAND_BITS = BITS // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+LANE = 32
+LANE_MASK = (1 << LANE) - 1
+SPREAD = tuple(
+    sum(1 << (LANE * bit) for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+
+def features(text, size=None):
+    size = size or SimHashConfig.shingle_size
+    tokens = tokenize(text)
+    if len(tokens) <= size:
+        return Counter([" ".join(tokens)] if tokens else [])
+    return Counter(
+        " ".join(tokens[index : index + size])
+        for index in range(len(tokens) - size + 1)
+    )
+
+
+def spread(value):
+    lanes = 0
+    for byte in range(8):
+        lanes |= SPREAD[value >> (8 * byte) & 0xFF] << (LANE * 8 * byte)
+    return lanes
+
+
+def to_signed(value):
+    return value - (1 << BITS) if value >> (BITS - 1) else value
+
+
+def simhash(text, min_features=None):
+    weighted = features(text)
+    if min_features is None:
+        min_features = SimHashConfig.min_features
+    if not weighted or len(weighted) < min_features:
+        return None
+
+    lanes = 0
+    total = 0
+    for feature, weight in weighted.items():
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        lanes += weight * spread(int.from_bytes(digest, "little"))
+        total += weight
+
+    fingerprint = 0
+    for bit in range(BITS):
+        if 2 * (lanes >> (LANE * bit) & LANE_MASK) > total:
+            fingerprint |= 1 << bit
+    return to_signed(fingerprint)
+
+
+def bands(fingerprint):
+    value = fingerprint & MASK
+    return [(value >> (BAND_BITS * band)) & BAND_MASK for band in range(BANDS)]
+
+
+def distance(first, second):
+    return bin((first ^ second) & MASK).count("1")
+
+
+class SimHashIndex:
+    def __init__(self, max_size=None):
+        self.max_size = max_size or SimHashConfig.index_size
+        self._fingerprints = OrderedDict()
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def add(self, key, fingerprint):
+        with self._lock:
+            if key in self._fingerprints:
+                self._remove(key)
+            self._fingerprints[key] = fingerprint
+            for entry in enumerate(bands(fingerprint)):
+                self._buckets.setdefault(entry, set()).add(key)
+            while len(self._fingerprints) > self.max_size:
+                self._remove(next(iter(self._fingerprints)))
+
+    def _remove(self, key):
+        fingerprint = self._fingerprints.pop(key)
+        for entry in enumerate(bands(fingerprint)):
+            bucket = self._buckets.get(entry)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[entry]
+
+    def query(self, fingerprint, max_distance=None):
+        if max_distance is None:
+            max_distance = SimHashConfig.max_distance
+        with self._lock:
+            candidates = set()
+            for entry in enumerate(bands(fingerprint)):
+                candidates.update(self._buckets.get(entry, ()))
+            matches = [
+                (distance(fingerprint, self._fingerprints[key]), key)
+                for key in candidates
+            ]
+        return sorted(
+            (match for match in matches if match[0] <= max_distance),
+            key=lambda match: match[0],
+        )
+
+    def __len__(self):
+        with self._lock:
+            return len(self._fingerprints)
+
+
+class NearDuplicateService:
+    @staticmethod
+    def band_rows(scrape: ScrapedData, fingerprint: int) -> list:
+        return [
+            SimHashBand(scraped_data=scrape, band=band, value=value)
+            for band, value in enumerate(bands(fingerprint))
+        ]
+
+    @staticmethod
+    def find(fingerprint, max_distance=None):
+        if fingerprint is None:
+            return None
+        if max_distance is None:
+            max_distance = SimHashConfig.max_distance
+
+        candidates = (
+            db.session.query(ScrapedData.id, ScrapedData.simhash)
+            .join(SimHashBand, SimHashBand.scraped_data_id == ScrapedData.id)
+            .filter(
+                or_(
+                    *(
+                        and_(SimHashBand.band == band, SimHashBand.value == value)
+                        for band, value in enumerate(bands(fingerprint))
+                    )
+                )
+            )
+            .distinct()
+            .yield_per(1000)
+        )
+        best = None
+        for scrape_id, candidate_hash in candidates:
+            candidate_distance = distance(fingerprint, candidate_hash)
+            if candidate_distance <= max_distance and (
+                best is None or candidate_distance < best[0]
+            ):
+                best = (candidate_distance, scrape_id)
+        if best is None:
+            return None
+        return ScrapedData.query.get(best[1])
+
+    @staticmethod
+    def backfill(batch_size: int = 500) -> int:
+        indexed = 0
+        last_id = 0
+        while True:
+            scrapes = (
+                ScrapedData.query.filter(
+                    ScrapedData.id > last_id,
+                    ScrapedData.simhash.is_(None),
+                    ScrapedData.canonical_id.is_(None),
+                )
+                .order_by(ScrapedData.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not scrapes:
+                return indexed
+
+            try:
+                for scrape in scrapes:
+                    fingerprint = simhash(ContentStore.text(scrape) or "")
+                    if fingerprint is None:
+                        continue
+                    scrape.simhash = fingerprint
+                    db.session.add_all(
+                        NearDuplicateService.band_rows(scrape, fingerprint)
+                    )
+                    indexed += 1
+                last_id = scrapes[-1].id
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
@@ -0,0 +1,104 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from urllib.parse import urlparse
+import threading
+
+import tldextract
+import whois
+from flask import current_app, has_app_context
+
+from app.config.config import WhoisConfig
+from app.modules.web_application.models.models import db, WhoisRecord
+from app.modules.web_application.methods.cache_methods import TTLCache
+
+_extract = tldextract.TLDExtract(suffix_list_urls=())
+LOOKUP_FAILED = object()
+
+
+def registrable_domain(url):
+    host = urlparse(url).hostname or ""
+    extracted = _extract(host)
+    return (extracted.registered_domain or host).lower()
+
+
+def normalize_whois(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: normalize_whois(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [normalize_whois(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class WhoisService:
+    def __init__(self, max_size=None, ttl=None, shared=None, workers=None):
+        self.ttl = ttl or WhoisConfig.ttl
+        self.shared = WhoisConfig.shared_cache if shared is None else shared
+        self.cache = TTLCache(max_size=max_size or WhoisConfig.cache_size, ttl=self.ttl)
+        self.executor = ThreadPoolExecutor(max_workers=workers or WhoisConfig.workers)
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def lookup_async(self, url) -> Future:
+        domain = registrable_domain(url)
+        cached = self.cache.get(domain) if domain else None
+        if cached is not None or not domain:
+            future = Future()
+            future.set_result(None if cached is LOOKUP_FAILED else cached)
+            return future
+
+        flask_app = current_app._get_current_object() if has_app_context() else None
+        with self._lock:
+            future = self._inflight.get(domain)
+            if future is None:
+                future = self.executor.submit(self._resolve, domain, flask_app)
+                self._inflight[domain] = future
+        return future
+
+    def lookup(self, url):
+        return self.lookup_async(url).result()
+
+    def _resolve(self, domain, flask_app):
+        try:
+            if flask_app is not None:
+                with flask_app.app_context():
+                    return self._resolve_with_shared(domain)
+            return self._resolve_from_network(domain)
+        finally:
+            with self._lock:
+                self._inflight.pop(domain, None)
+
+    def _resolve_with_shared(self, domain):
+        if self.shared:
+            record = WhoisRecord.query.get(domain)
+            if record and record.fetched_at > datetime.utcnow() - timedelta(
+                seconds=self.ttl
+            ):
+                self.cache.set(domain, record.data)
+                return record.data
+
+        info = self._resolve_from_network(domain)
+        if info is not None and self.shared:
+            try:
+                db.session.merge(
+                    WhoisRecord(domain=domain, data=info, fetched_at=datetime.utcnow())
+                )
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+        return info
+
+    def _resolve_from_network(self, domain):
+        try:
+            info = normalize_whois(dict(whois.whois(domain)))
+        except Exception:
+            self.cache.set(domain, LOOKUP_FAILED, ttl=WhoisConfig.failure_ttl)
+            return None
+        self.cache.set(domain, info)
+        return info
+
+    def close(self):
+        self.executor.shutdown(wait=False)
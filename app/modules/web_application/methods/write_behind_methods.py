@@ -0,0 +1,180 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from flask import current_app, has_app_context
+from sqlalchemy import insert
+
+from app.config.config import WriteBehindConfig
+from app.modules.web_application.methods.metrics_methods import registry
+from app.modules.web_application.models.models import app, db
+
+logger = logging.getLogger(__name__)
+
+FLUSH_SECONDS = registry.histogram(
+    "ideh_write_behind_flush_seconds", "Write-behind batch flush latency"
+)
+
+
+class WriteBehindQueue:
+    def __init__(
+        self,
+        enabled=None,
+        batch_size=None,
+        flush_interval=None,
+        max_queue=None,
+        flask_app=None,
+    ):
+        self.enabled = WriteBehindConfig.enabled if enabled is None else enabled
+        self.batch_size = batch_size or WriteBehindConfig.batch_size
+        self.flush_interval = flush_interval or WriteBehindConfig.flush_interval
+        self.flask_app = flask_app
+        self.queue = queue.Queue(maxsize=max_queue or WriteBehindConfig.max_queue)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._metrics = {
+            "enqueued": 0,
+            "overflow": 0,
+            "flushed": 0,
+            "failed": 0,
+            "batches": 0,
+            "flush_seconds_total": 0.0,
+            "flush_seconds_max": 0.0,
+            "flush_seconds_last": 0.0,
+        }
+
+    def submit(self, model, row) -> bool:
+        if not self.enabled or self._stop.is_set():
+            return False
+        self.start()
+        try:
+            self.queue.put((model, row), timeout=WriteBehindConfig.enqueue_timeout)
+        except queue.Full:
+            self._count("overflow")
+            return False
+        self._count("enqueued")
+        return True
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                if self.flask_app is None:
+                    self.flask_app = (
+                        current_app._get_current_object() if has_app_context() else app
+                    )
+                self._thread = threading.Thread(
+                    target=self._run, name="write-behind", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        while not (self._stop.is_set() and self.queue.empty()):
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0 and not self._stop.is_set():
+                        batch.append(self.queue.get(timeout=remaining))
+                    else:
+                        batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self.flush_batch(batch)
+
+    def flush_batch(self, batch):
+        groups = {}
+        for model, row in batch:
+            groups.setdefault(model, []).append(row)
+
+        started = time.perf_counter()
+        with self.flask_app.app_context():
+            try:
+                for model, rows in groups.items():
+                    db.session.execute(insert(model), rows)
+                db.session.commit()
+                flushed, failed = len(batch), 0
+            except Exception:
+                db.session.rollback()
+                logger.exception("Write-behind batch of %d rows failed", len(batch))
+                flushed, failed = self.flush_rows(batch)
+            finally:
+                db.session.remove()
+        elapsed = time.perf_counter() - started
+        FLUSH_SECONDS.observe(elapsed)
+
+        with self._lock:
+            metrics = self._metrics
+            metrics["flushed"] += flushed
+            metrics["failed"] += failed
+            metrics["batches"] += 1
+            metrics["flush_seconds_total"] += elapsed
+            metrics["flush_seconds_last"] = elapsed
+            metrics["flush_seconds_max"] = max(metrics["flush_seconds_max"], elapsed)
+        for _ in batch:
+            self.queue.task_done()
+
+    def flush_rows(self, batch):
+        flushed = failed = 0
+        for model, row in batch:
+            try:
+                db.session.execute(insert(model), [row])
+                db.session.commit()
+                flushed += 1
+            except Exception:
+                db.session.rollback()
+                logger.exception("Dropping write-behind row for %s", model.__name__)
+                failed += 1
+        return flushed, failed
+
+    def flush(self):
+        if self._thread is not None:
+            self.queue.join()
+
+    def close(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _count(self, name):
+        with self._lock:
+            self._metrics[name] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            metrics = dict(self._metrics)
+        batches = metrics["batches"]
+        metrics["flush_seconds_avg"] = (
+            metrics["flush_seconds_total"] / batches if batches else 0.0
+        )
+        metrics["depth"] = self.queue.qsize()
+        metrics["enabled"] = self.enabled
+        return metrics
+
+
+write_behind = WriteBehindQueue()
+
+registry.callback(
+    "ideh_write_behind_depth",
+    "Rows waiting in the write-behind queue",
+    lambda: write_behind.queue.qsize(),
+)
+registry.callback(
+    "ideh_write_behind_rows_total",
+    "Write-behind rows by outcome",
+    lambda: {
+        outcome: write_behind.stats()[outcome]
+        for outcome in ("enqueued", "overflow", "flushed", "failed")
+    },
+    ["outcome"],
+    type="counter",
+)
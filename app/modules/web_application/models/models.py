@@ -1,20 +1,31 @@
 from datetime import datetime
 from flask import Flask
+from flask_dance.consumer.storage.sqla import OAuthConsumerMixin
 from flask_sqlalchemy import SQLAlchemy
 
+from app.config.config import Config
+
 app = Flask(__name__)
+app.config["SQLALCHEMY_DATABASE_URI"] = (
+    Config.postgres_connection_string or "sqlite:///test.db"
+)
+app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = Config.track_modifications
 db = SQLAlchemy(app)
 
 
 class User(db.Model):
     __tablename__ = "users"
+    __table_args__ = (db.Index("ix_users_created_at_id", "created_at", "id"),)
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    social_login_provider = db.Column(db.String(50))
+    social_login_provider = db.Column(db.String(50), index=True)
     profile_picture = db.Column(db.String(200))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
     scraped_data = db.relationship("ScrapedData", backref="user", lazy=True)
     prompt_logs = db.relationship("PromptLog", backref="user", lazy=True)
 
@@ -22,38 +33,194 @@ class User(db.Model):
         return f"<User {self.name}>"
 
 
+EXTRACTION_FIELDS = (
+    "name",
+    "about",
+    "source_type",
+    "industry",
+    "page_content_type",
+    "contact",
+    "email",
+    "title",
+    "description",
+    "domain",
+    "domain_info",
+    "industry_scores",
+)
+SCRAPE_FIELDS = (
+    ("id", "url")
+    + EXTRACTION_FIELDS
+    + ("fetch_tier", "content_hash", "canonical_id", "created_at")
+)
+
+
+class ScrapedContent(db.Model):
+    __tablename__ = "scraped_content"
+
+    id = db.Column(db.Integer, primary_key=True)
+    content_hash = db.Column(db.String(64), unique=True, nullable=False)
+    codec = db.Column(db.String(10), nullable=False)
+    size = db.Column(db.Integer, nullable=False)
+    stored_size = db.Column(db.Integer, nullable=False)
+    data = db.deferred(db.Column(db.LargeBinary, nullable=False))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ScrapedContent {self.content_hash}>"
+
+
 class ScrapedData(db.Model):
     __tablename__ = "scraped_data"
+    __table_args__ = (
+        db.Index(
+            "ix_scraped_data_user_created_at_id",
+            "created_by_user_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     url = db.Column(db.String(500), nullable=False)
-    content = db.Column(db.Text)
-    metadata = db.Column(db.JSON)
+    content = db.deferred(db.Column(db.Text))
+    content_id = db.Column(db.Integer, db.ForeignKey("scraped_content.id"))
+    page_metadata = db.Column("metadata", db.JSON)
+    name = db.Column(db.String(300))
+    about = db.Column(db.Text)
+    source_type = db.Column(db.String(100))
+    industry = db.Column(db.String(100))
+    page_content_type = db.Column(db.String(100))
+    contact = db.Column(db.String(500))
+    email = db.Column(db.String(255))
+    title = db.Column(db.String(500))
+    description = db.Column(db.Text)
+    fetch_tier = db.Column(db.String(20))
+    domain = db.Column(db.String(255), index=True)
+    domain_info = db.Column(db.JSON)
+    industry_scores = db.Column(db.JSON)
+    content_hash = db.Column(db.String(64), index=True)
+    simhash = db.Column(db.BigInteger)
+    canonical_id = db.Column(db.Integer, db.ForeignKey("scraped_data.id"))
     created_by_user_id = db.Column(
         db.Integer, db.ForeignKey("users.id"), nullable=False
     )
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    user_id = db.synonym("created_by_user_id")
+    canonical = db.relationship("ScrapedData", remote_side=[id])
+    content_blob = db.relationship(ScrapedContent)
+
+    def to_dict(self, fields=None):
+        source = self.canonical if self.canonical_id else self
+        data = {}
+        for field in fields or SCRAPE_FIELDS:
+            value = getattr(source if field in EXTRACTION_FIELDS else self, field)
+            data[field] = value.isoformat() if isinstance(value, datetime) else value
+        return data
 
     def __repr__(self):
         return f"<ScrapedData {self.url}>"
 
 
+class SimHashBand(db.Model):
+    __tablename__ = "scraped_simhash_bands"
+    __table_args__ = (db.Index("ix_scraped_simhash_bands_band_value", "band", "value"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    scraped_data_id = db.Column(
+        db.Integer, db.ForeignKey("scraped_data.id"), nullable=False, index=True
+    )
+    band = db.Column(db.SmallInteger, nullable=False)
+    value = db.Column(db.Integer, nullable=False)
+    scraped_data = db.relationship(ScrapedData)
+
+    def __repr__(self):
+        return f"<SimHashBand {self.band}:{self.value}>"
+
+
+class UrlFetchCache(db.Model):
+    __tablename__ = "url_fetch_cache"
+
+    id = db.Column(db.Integer, primary_key=True)
+    url = db.Column(db.String(500), unique=True, nullable=False)
+    etag = db.Column(db.String(255))
+    last_modified = db.Column(db.String(64))
+    content_hash = db.Column(db.String(64))
+    scraped_data_id = db.Column(db.Integer, db.ForeignKey("scraped_data.id"))
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow)
+    scraped_data = db.relationship(ScrapedData)
+
+    def __repr__(self):
+        return f"<UrlFetchCache {self.url}>"
+
+
 class PromptLog(db.Model):
     __tablename__ = "prompt_logs"
 
     id = db.Column(db.Integer, primary_key=True)
     prompt_text = db.Column(db.Text, nullable=False)
     generated_output = db.Column(db.Text)
+    created_by_user_id = db.Column(db.Integer, db.ForeignKey("users.id"))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<PromptLog {self.id}>"
+
+
+class WhoisRecord(db.Model):
+    __tablename__ = "whois_records"
+
+    domain = db.Column(db.String(255), primary_key=True)
+    data = db.Column(db.JSON)
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<WhoisRecord {self.domain}>"
+
+
+class ScrapeJob(db.Model):
+    __tablename__ = "scrape_jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    total = db.Column(db.Integer, nullable=False, default=0)
+    completed = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
     created_by_user_id = db.Column(
         db.Integer, db.ForeignKey("users.id"), nullable=False
     )
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+    items = db.relationship(
+        "ScrapeJobItem", backref="job", lazy="dynamic", order_by="ScrapeJobItem.id"
+    )
 
     def __repr__(self):
-        return f"<PromptLog {self.id}>"
+        return f"<ScrapeJob {self.id} {self.status}>"
+
+
+class ScrapeJobItem(db.Model):
+    __tablename__ = "scrape_job_items"
+    __table_args__ = (db.Index("ix_scrape_job_items_status_id", "status", "id"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(
+        db.Integer, db.ForeignKey("scrape_jobs.id"), nullable=False, index=True
+    )
+    url = db.Column(db.String(500), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text)
+    scraped_data_id = db.Column(db.Integer, db.ForeignKey("scraped_data.id"))
+    claimed_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f"<ScrapeJobItem {self.id} {self.status}>"
 
 
-class OAuth(db.Model):
+class OAuth(OAuthConsumerMixin, db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey(User.id))
     user = db.relationship(User)
 
@@ -0,0 +1,10 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.modules.web_application.models.models import app
+from app.modules.web_application.methods.search_methods import UserSearch
+
+if __name__ == "__main__":
+    with app.app_context():
+        print(f"Search index ready for {UserSearch.setup()}")
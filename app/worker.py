@@ -0,0 +1,18 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.modules.web_application.methods.job_methods import ScrapeJobWorker
+from app.modules.web_application.methods.scrapping_methods import WebScraperMethods
+
+
+if __name__ == "__main__":
+    scraper = WebScraperMethods()
+    worker = ScrapeJobWorker(scraper)
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.stop()
+        scraper.close()
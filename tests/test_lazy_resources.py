@@ -0,0 +1,145 @@
+import gc
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from app.modules.web_application.methods import lazy_methods
+from app.modules.web_application.methods.lazy_methods import LazyResource
+
+IMPORT_BUDGET_SECONDS = 2.0
+
+IMPORT_SCRIPT = textwrap.dedent("""
+    import json
+    import sys
+    import time
+
+    sys.path.insert(0, sys.argv[1])
+    import langchain.llms
+    import webdriver_manager.chrome
+
+    calls = []
+
+
+    class ChromeDriverManager:
+        def __init__(self, *args, **kwargs):
+            calls.append("ChromeDriverManager")
+
+        def install(self):
+            calls.append("ChromeDriverManager.install")
+            return "/nonexistent/chromedriver"
+
+
+    class OpenAI:
+        def __init__(self, *args, **kwargs):
+            calls.append("OpenAI")
+
+
+    webdriver_manager.chrome.ChromeDriverManager = ChromeDriverManager
+    langchain.llms.OpenAI = OpenAI
+
+    started = time.perf_counter()
+    from app.modules.web_application.api import prompt_routes, scrapping_routes
+
+    elapsed = time.perf_counter() - started
+    print(
+        json.dumps(
+            {
+                "calls": calls,
+                "import_seconds": elapsed,
+                "ready": {
+                    "scraper": scrapping_routes.scraper.ready,
+                    "crawl_scheduler": scrapping_routes.crawl_scheduler.ready,
+                    "prompt_service": prompt_routes.processor.ready,
+                },
+            }
+        )
+    )
+    """)
+
+
+@pytest.fixture(scope="module")
+def route_import():
+    env = dict(os.environ, pg_connection_string="sqlite://")
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT, ROOT],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_route_import_runs_no_factory(route_import):
+    assert route_import["calls"] == []
+    assert not any(route_import["ready"].values())
+
+
+def test_route_import_within_budget(route_import):
+    assert route_import["import_seconds"] < IMPORT_BUDGET_SECONDS
+
+
+def test_get_creates_once_per_process():
+    created = []
+    resource = LazyResource(lambda: created.append(object()) or created[-1])
+
+    first = resource.get()
+    assert resource.get() is first
+    assert created == [first]
+
+
+def test_released_resources_leave_registry():
+    resource = LazyResource(object)
+    resource.get()
+    assert resource in lazy_methods.resources
+
+    count = len(lazy_methods.resources)
+    del resource
+    gc.collect()
+    assert len(lazy_methods.resources) == count - 1
+
+
+def test_pid_change_recreates_value(monkeypatch):
+    created = []
+    resource = LazyResource(lambda: created.append(object()) or created[-1])
+    first = resource.get()
+
+    monkeypatch.setattr(os, "getpid", lambda: -1)
+    assert not resource.ready
+    second = resource.get()
+    assert second is not first
+    assert len(created) == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_fork_resets_value():
+    created = []
+    resource = LazyResource(lambda: created.append(os.getpid()) or object())
+    resource.get()
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        state = {"reset": resource._value is None and not resource.ready}
+        resource.get()
+        state["created"] = created
+        os.write(write_end, json.dumps(state).encode("utf-8"))
+        os._exit(0)
+
+    os.close(write_end)
+    with os.fdopen(read_end) as reader:
+        state = json.loads(reader.read())
+    os.waitpid(pid, 0)
+
+    assert state["reset"]
+    assert state["created"] == [os.getpid(), pid]
+    assert resource.ready
+    assert created == [os.getpid()]